@@ -0,0 +1,373 @@
+"""
+Headless benchmarks for screens_manager.
+
+Runs under a virtual X server: when no DISPLAY is set, an Xvfb server is
+started for the duration of the run. Results are written as JSON so runs of
+different releases can be compared:
+
+    python benchmark.py --output bench_new.json
+    python benchmark.py --output bench_new.json --compare bench_old.json
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import tkinter
+
+import customtkinter as ctk
+from screens_manager import *
+
+
+# ─────────────────────────────────────────────
+#  Helpers
+# ─────────────────────────────────────────────
+
+def start_virtual_display(display: str):
+    """Starts Xvfb when no display is available. Returns the process or None."""
+    if os.environ.get("DISPLAY"):
+        return None
+
+    xvfb = shutil.which("Xvfb")
+    if not xvfb:
+        sys.exit("No DISPLAY set and Xvfb was not found. Install Xvfb or run under xvfb-run.")
+
+    proc = subprocess.Popen(
+        [xvfb, display, "-screen", "0", "1280x800x24", "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    os.environ["DISPLAY"] = display
+
+    # Wait until the server accepts connections
+    deadline = time.perf_counter() + 5
+    while time.perf_counter() < deadline:
+        if os.path.exists(f"/tmp/.X11-unix/X{display.lstrip(':')}"):
+            break
+        time.sleep(0.05)
+    return proc
+
+
+def new_window() -> ctk.CTk:
+    """Creates a mapped window of fixed size."""
+    root = ctk.CTk()
+    root.geometry("800x600")
+    root.update()
+    return root
+
+
+def pump_until(root, condition, timeout: float = 10.0):
+    """Processes Tk events until condition() is true."""
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("Benchmark step did not finish in time.")
+        root.update()
+
+
+def light_screen(frame):
+    ctk.CTkLabel(frame, text="Light").pack(expand=True)
+
+
+def heavy_screen(frame, rows: int = 30, columns: int = 10):
+    for r in range(rows):
+        for c in range(columns):
+            ctk.CTkLabel(frame, text=f"{r}:{c}").grid(row=r, column=c, padx=2, pady=1)
+
+
+def summarize(values: list[float]) -> dict:
+    """Median, minimum and maximum of repeated measurements."""
+    return {
+        "median": statistics.median(values),
+        "min":    min(values),
+        "max":    max(values),
+    }
+
+
+def nav_items(count: int) -> list[NavItem]:
+    return [NavItem(screen=f"s{i}", label=f"Screen {i}", icon="•") for i in range(count)]
+
+
+# ─────────────────────────────────────────────
+#  Benchmarks
+# ─────────────────────────────────────────────
+
+def bench_set_screens(repeat: int) -> dict:
+    """Time of set_screens() for eager and lazy screens."""
+    results = {}
+    for count in (10, 100, 1000):
+        names = [f"s{i}" for i in range(count)]
+        eager, lazy = [], []
+
+        for _ in range(repeat):
+            root = new_window()
+            manager = ScreensManager(root, transition=TRANSITION_NONE)
+            start = time.perf_counter()
+            manager.set_screens(*names, initial=names[0])
+            root.update_idletasks()
+            eager.append((time.perf_counter() - start) * 1000)
+            root.destroy()
+
+            root = new_window()
+            manager = ScreensManager(root, transition=TRANSITION_NONE)
+            start = time.perf_counter()
+            manager.set_screens(*names, initial=names[0], factories={n: light_screen for n in names})
+            root.update_idletasks()
+            lazy.append((time.perf_counter() - start) * 1000)
+            root.destroy()
+
+        results[str(count)] = {"eager_ms": summarize(eager), "lazy_ms": summarize(lazy)}
+    return results
+
+
+def bench_navigate_none(repeat: int, navigations: int = 1000) -> dict:
+    """Throughput of navigate() without animation."""
+    names = [f"s{i}" for i in range(20)]
+    per_nav = []
+
+    for _ in range(repeat):
+        root = new_window()
+        manager = ScreensManager(root, transition=TRANSITION_NONE)
+        manager.set_screens(*names, initial=names[0])
+
+        start = time.perf_counter()
+        for i in range(1, navigations + 1):
+            manager.navigate(names[i % len(names)])
+        per_nav.append((time.perf_counter() - start) * 1e6 / navigations)
+        root.destroy()
+
+    median = statistics.median(per_nav)
+    return {"per_navigation_us": summarize(per_nav), "navigations_per_s": 1e6 / median}
+
+
+def bench_transitions(repeat: int, duration: int = 250) -> dict:
+    """Frame cadence of every built-in transition on light and heavy screens."""
+    results = {}
+    for transition in (TRANSITION_SLIDE, TRANSITION_FADE, TRANSITION_COVER, TRANSITION_REVEAL, TRANSITION_PUSH, TRANSITION_SCALE):
+        for weight, factory in (("light", light_screen), ("heavy", heavy_screen)):
+            elapsed, rendered, planned, intervals = [], [], [], []
+
+            for _ in range(repeat):
+                root = new_window()
+                manager = ScreensManager(root, transition=transition, duration=duration)
+                manager.set_screens("a", "b", initial="a")
+                factory(manager.a)
+                factory(manager.b)
+                root.update()
+
+                # Timestamps of every rendered frame
+                stamps = []
+                manager.navigate("b")
+                tween = manager.scheduler.active[0]
+                update = tween.update
+                tween.update = lambda progress: (stamps.append(time.perf_counter()), update(progress))
+
+                pump_until(root, lambda: not manager._animating)
+                report = manager.last_transition
+                elapsed.append(report.elapsed)
+                rendered.append(report.frames_rendered)
+                planned.append(report.planned_frames)
+                intervals.extend((b - a) * 1000 for a, b in zip(stamps, stamps[1:]))
+                root.destroy()
+
+            intervals.sort()
+            results[f"{transition}_{weight}"] = {
+                "elapsed_ms":      summarize(elapsed),
+                "frames_rendered": summarize(rendered),
+                "frames_planned":  summarize(planned),
+                "interval_p50_ms": intervals[len(intervals) // 2] if intervals else None,
+                "interval_p90_ms": intervals[int(len(intervals) * 0.9)] if intervals else None,
+                "interval_max_ms": intervals[-1] if intervals else None,
+            }
+    return results
+
+
+def bench_drawer(repeat: int) -> dict:
+    """open_drawer() time to first frame against the number of nav items."""
+    results = {}
+    for count in (10, 50, 200):
+        for persistent in (False, True):
+            for _ in range(repeat):
+                root = new_window()
+                manager = ScreensManager(
+                    root,
+                    transition=TRANSITION_NONE,
+                    nav_mode=NAV_DRAWER,
+                    nav_items=nav_items(count),
+                    drawer_style=DrawerStyle(persistent=persistent, enable_swipe=False),
+                    metrics=True,
+                )
+                manager.set_screens(initial="s0")
+                root.update()
+
+                manager.open_drawer()
+                pump_until(root, lambda: manager.last_drawer_transition is not None)
+                manager.close_drawer()
+                pump_until(root, lambda: not manager._drawer_open)
+
+                stats = manager.metrics_stats()
+                results.setdefault(f"{count}_{'persistent' if persistent else 'rebuild'}", []).append(
+                    stats["drawer_open_ms"]["p50"]
+                )
+                root.destroy()
+
+    return {key: {"first_frame_ms": summarize(values)} for key, values in results.items()}
+
+
+def bench_update_nav_active(repeat: int, calls: int = 500) -> dict:
+    """Cost of highlighting the active bottom bar item."""
+    results = {}
+    for count in (10, 100, 1000):
+        per_call = []
+        for _ in range(repeat):
+            root = new_window()
+            manager = ScreensManager(
+                root,
+                transition=TRANSITION_NONE,
+                nav_mode=NAV_BOTTOM,
+                nav_items=[
+                    NavItem(screen=item.screen, label=item.label, active_style={"text_color": "#4FC3F7"})
+                    for item in nav_items(count)
+                ],
+            )
+            manager.set_screens(initial="s0")
+            root.update()
+
+            start = time.perf_counter()
+            for i in range(calls):
+                manager._update_nav_active(f"s{i % count}")
+            per_call.append((time.perf_counter() - start) * 1e6 / calls)
+            root.destroy()
+
+        results[str(count)] = {"per_call_us": summarize(per_call)}
+    return results
+
+
+def bench_startup(repeat: int) -> dict:
+    """Time to the first frame of set_screens() with eager and deferred nav chrome."""
+    results = {}
+    for nav_mode in (NAV_BOTTOM, NAV_DRAWER):
+        for defer_nav in (False, True):
+            first_frame, nav = [], []
+            for _ in range(repeat):
+                root = new_window()
+                manager = ScreensManager(
+                    root,
+                    transition=TRANSITION_NONE,
+                    nav_mode=nav_mode,
+                    nav_items=nav_items(50),
+                    defer_nav=defer_nav,
+                )
+                manager.set_screens(initial="s0", factories={f"s{i}": heavy_screen for i in range(50)})
+                report = manager.last_startup
+                pump_until(root, lambda: report.first_frame_ms and report.nav_ms)
+                first_frame.append(report.first_frame_ms)
+                nav.append(report.nav_ms)
+                root.destroy()
+
+            results[f"{nav_mode}_{'deferred' if defer_nav else 'eager'}"] = {
+                "first_frame_ms": summarize(first_frame),
+                "nav_ms":         summarize(nav),
+            }
+    return results
+
+
+BENCHMARKS = {
+    "set_screens":       bench_set_screens,
+    "navigate_none":     bench_navigate_none,
+    "transitions":       bench_transitions,
+    "drawer_open":       bench_drawer,
+    "update_nav_active": bench_update_nav_active,
+    "startup":           bench_startup,
+}
+
+
+# ─────────────────────────────────────────────
+#  Comparison
+# ─────────────────────────────────────────────
+
+def flatten(data, prefix: str = "") -> dict[str, float]:
+    """Flattens nested results into "a.b.c" keys, keeping the medians."""
+    flat = {}
+    for key, value in data.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            if "median" in value:
+                flat[path] = value["median"]
+            else:
+                flat.update(flatten(value, path))
+        elif isinstance(value, (int, float)):
+            flat[path] = value
+    return flat
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> bool:
+    """Prints relative changes. Returns False if a metric regressed beyond threshold."""
+    new, old = flatten(current["results"]), flatten(baseline["results"])
+    ok = True
+    for key in sorted(new.keys() & old.keys()):
+        if not old[key]:
+            continue
+        change = (new[key] - old[key]) / old[key] * 100
+
+        # Throughput metrics improve upwards, everything else downwards
+        regressed = -change if key.endswith("_per_s") else change
+        marker = ""
+        if regressed > threshold:
+            marker, ok = "  REGRESSION", False
+        print(f"{key:60} {old[key]:12.3f} -> {new[key]:12.3f} ({change:+6.1f}%){marker}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout.")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against.")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Regression threshold in percent.")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per measurement.")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Run only these benchmarks.")
+    parser.add_argument("--display", default=":99", help="Display used when starting Xvfb.")
+    args = parser.parse_args()
+
+    xvfb = start_virtual_display(args.display)
+    try:
+        results = {}
+        for name in args.only or BENCHMARKS:
+            print(f"Running {name}...", file=sys.stderr)
+            results[name] = BENCHMARKS[name](args.repeat)
+    finally:
+        if xvfb:
+            xvfb.terminate()
+
+    output = {
+        "meta": {
+            "python":        platform.python_version(),
+            "platform":      platform.platform(),
+            "tk":            tkinter.TkVersion,
+            "customtkinter": ctk.__version__,
+            "repeat":        args.repeat,
+            "timestamp":     time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+    text = json.dumps(output, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if not compare(output, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,116 @@
-import customtkinter as ctk
+from __future__ import annotations
+
+import time
+
+_MODULE_STARTED = time.perf_counter()
+
+import importlib
+import os
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict, deque
+from collections.abc import Callable, Iterator
+from functools import partial
+
+__all__ = [
+    "TRANSITION_NONE", "TRANSITION_FADE", "TRANSITION_SLIDE",
+    "TRANSITION_COVER", "TRANSITION_REVEAL", "TRANSITION_PUSH", "TRANSITION_SCALE",
+    "EASE_LINEAR", "EASE_OUT", "EASE_IN_OUT", "EASE_OUT_CUBIC",
+    "Transition", "SlideTransition", "ScaleTransition", "FadeTransition",
+    "TRANSITIONS", "EASINGS", "register_transition", "register_easing",
+    "SLIDE_LEFT", "SLIDE_RIGHT", "SLIDE_UP", "SLIDE_DOWN", "FRAME_MS",
+    "BUSY_DROP", "BUSY_QUEUE", "BUSY_LATEST", "BUSY_INTERRUPT",
+    "CALLBACK_SYNC", "CALLBACK_DEFERRED", "CALLBACK_THREADED",
+    "NAV_NONE", "NAV_BOTTOM", "NAV_DRAWER", "PATH_SEPARATOR",
+    "NavItem", "BottomBarStyle", "DrawerStyle", "ScreenHooks",
+    "TransitionReport", "StartupReport", "Tween", "AnimationScheduler",
+    "NavigationMetrics", "ScreensManager",
+]
+
+
+# ─────────────────────────────────────────────
+#  Lazy Imports
+#  (nothing heavy is imported before a manager is used)
+# ─────────────────────────────────────────────
+
+_IMPORT_MS: dict[str, float] = {}     # Module name -> time its lazy import took
+
+
+class _LazyModule:
+    """
+    Stands in for a module until one of its attributes is used. The module
+    is then imported and replaces the stand-in in this module's globals.
+    """
+    def __init__(self, alias: str, name: str):
+        self._alias = alias
+        self._name  = name
+
+    def __getattr__(self, attr: str):
+        started = time.perf_counter()
+        module  = importlib.import_module(self._name)
+        _IMPORT_MS.setdefault(self._name, (time.perf_counter() - started) * 1000)
+        globals()[self._alias] = module
+        return getattr(module, attr)
+
+
+ctk      = _LazyModule("ctk",      "customtkinter")
+tk       = _LazyModule("tk",       "tkinter")
+asyncio  = _LazyModule("asyncio",  "asyncio")
+futures  = _LazyModule("futures",  "concurrent.futures")
+inspect  = _LazyModule("inspect",  "inspect")
+json     = _LazyModule("json",     "json")
+queue    = _LazyModule("queue",    "queue")
+tempfile = _LazyModule("tempfile", "tempfile")
 
 # ─────────────────────────────────────────────
 #  Transition Constants
 # ─────────────────────────────────────────────
-TRANSITION_NONE  = "none"
-TRANSITION_FADE  = "fade"
-TRANSITION_SLIDE = "slide"
+TRANSITION_NONE   = "none"
+TRANSITION_FADE   = "fade"
+TRANSITION_SLIDE  = "slide"
+TRANSITION_COVER  = "cover"    # Incoming screen slides over the resting outgoing one
+TRANSITION_REVEAL = "reveal"   # Outgoing screen slides away from the resting incoming one
+TRANSITION_PUSH   = "push"     # Slide where the outgoing screen trails behind (parallax)
+TRANSITION_SCALE  = "scale"    # Incoming screen grows from the center
+
+EASE_LINEAR    = "linear"
+EASE_OUT       = "ease_out"
+EASE_IN_OUT    = "ease_in_out"
+EASE_OUT_CUBIC = "ease_out_cubic"
 
 SLIDE_LEFT  = "left"
 SLIDE_RIGHT = "right"
 SLIDE_UP    = "up"
 SLIDE_DOWN  = "down"
 
+FRAME_MS = 16                 # Target frame interval of all animations
+COARSE_FADE_STEPS = 4         # Color steps of a fade degraded by adaptive_quality
+
+# Direction a history step back slides in
+_OPPOSITE = {
+    SLIDE_LEFT:  SLIDE_RIGHT,
+    SLIDE_RIGHT: SLIDE_LEFT,
+    SLIDE_UP:    SLIDE_DOWN,
+    SLIDE_DOWN:  SLIDE_UP,
+}
+
+# ─────────────────────────────────────────────
+#  Busy Policy Constants
+#  (navigations requested during a transition)
+# ─────────────────────────────────────────────
+BUSY_DROP      = "drop"       # Ignore the request
+BUSY_QUEUE     = "queue"      # Run every request, one after another
+BUSY_LATEST    = "latest"     # Run only the most recent request afterwards
+BUSY_INTERRUPT = "interrupt"  # Retarget the running transition right away
+
+# ─────────────────────────────────────────────
+#  Callback Mode Constants
+# ─────────────────────────────────────────────
+CALLBACK_SYNC     = "sync"       # Run before the transition starts
+CALLBACK_DEFERRED = "deferred"   # Run at idle once the transition has finished
+CALLBACK_THREADED = "threaded"   # Run on a worker thread
+
 # ─────────────────────────────────────────────
 #  Navigation Constants
 # ─────────────────────────────────────────────
@@ -19,6 +118,10 @@ NAV_NONE   = "none"           # User manages their own navigation triggers
 NAV_BOTTOM = "bottom_bar"     # Integrated Bottom App Bar
 NAV_DRAWER = "drawer"         # Integrated Navigation Drawer
 
+PATH_SEPARATOR = "/"          # Separates levels of nested managers, e.g. "settings/network"
+
+_SESSION_VERSION = 1          # Format of session files, see ScreensManager(session_path=...)
+
 
 class NavItem:
     """
@@ -61,6 +164,8 @@ class BottomBarStyle:
         button_width (int): Fixed width for each button.
         button_height (int): Fixed height for each button.
         layout (str): Display mode: "icon_only", "label_only", or "icon_top".
+        virtualize (bool): Only create the buttons needed to fill the visible
+            part of the bar and rebind them while scrolling.
     """
     def __init__(
         self,
@@ -74,6 +179,7 @@ class BottomBarStyle:
         button_width: int = 80,
         button_height: int = 48,
         layout: str = "icon_top",
+        virtualize: bool = False,
     ):
         self.height        = height
         self.fg_color      = fg_color
@@ -85,6 +191,7 @@ class BottomBarStyle:
         self.button_width  = button_width
         self.button_height = button_height
         self.layout        = layout
+        self.virtualize    = virtualize
 
 
 class DrawerStyle:
@@ -100,8 +207,10 @@ class DrawerStyle:
         duration (int): Animation duration in milliseconds.
         show_hamburger (bool): Whether to display a floating hamburger button.
         hamburger_style (dict): Customization for the hamburger button.
-        enable_swipe (bool): Allows opening/closing via edge dragging.
-        swipe_threshold (int): Minimum pixels to trigger a swipe action.
+        enable_swipe (bool): Allows opening/closing by dragging the drawer,
+            which follows the pointer.
+        swipe_threshold (int): Pixels the pointer has to travel before the
+            drawer starts following it.
         icon_font (tuple): Font for item icons.
         label_font (tuple): Font for item labels.
         button_height (int): Height of each drawer item.
@@ -110,6 +219,14 @@ class DrawerStyle:
         header (str): Optional header text at the top.
         header_font (tuple): Font for the header text.
         header_style (dict): Kwargs for the header label customization.
+        persistent (bool): Build the drawer once, at idle after setup, and keep
+            it hidden between uses instead of rebuilding it on every open.
+        virtualize (bool): Only create the buttons needed to fill the visible
+            part of the drawer and rebind them while scrolling.
+        edge_width (int): Width of the window edge a closed drawer can be
+            dragged out from.
+        fling_velocity (float): Release speed in pixels per millisecond from
+            which a drag settles in its direction, however far it got.
     """
     def __init__(
         self,
@@ -131,6 +248,10 @@ class DrawerStyle:
         header: str | None = None,
         header_font: tuple = ("Arial", 15, "bold"),
         header_style: dict | None = None,
+        persistent: bool = False,
+        virtualize: bool = False,
+        edge_width: int = 40,
+        fling_velocity: float = 0.5,
     ):
         self.width           = width
         self.side            = side
@@ -150,6 +271,729 @@ class DrawerStyle:
         self.header          = header
         self.header_font     = header_font
         self.header_style    = header_style or {}
+        self.persistent      = persistent
+        self.virtualize      = virtualize
+        self.edge_width      = edge_width
+        self.fling_velocity  = fling_velocity
+
+
+class ScreenHooks:
+    """
+    Optional lifecycle callbacks attached to a single screen.
+
+    Attributes:
+        on_evict (callable): Called with the screen frame right before an
+            evicted screen is destroyed. Its return value is kept and handed
+            back to on_restore.
+        on_restore (callable): Called with (frame, state) after an evicted
+            screen has been rebuilt through its factory.
+        on_enter (callable): Called with the frame once a transition to the
+            screen has finished.
+        on_leave (callable): Called with the frame when a navigation away
+            from the screen starts.
+        loader (callable): Called with the screen name off the Tk thread every
+            time the screen is navigated to. Coroutine functions run on an
+            asyncio loop, plain functions on the thread pool.
+        on_loaded (callable): Called on the Tk thread with (frame, data) once
+            the loader returned, unless the user has navigated away since.
+        placeholder (callable): Called with the frame to build the widget
+            shown while the loader runs. Defaults to a "Loading…" label.
+        save_state (callable): Called with the frame when a navigation away
+            from the screen is recorded in the history. Its return value
+            (scroll position, form values, …) is kept with the entry, also
+            when the screen is evicted.
+        restore_state (callable): Called with (frame, state) when go_back() or
+            go_forward() returns to the screen, before the transition starts.
+    """
+    def __init__(
+        self,
+        on_evict: Callable | None = None,
+        on_restore: Callable | None = None,
+        on_enter: Callable | None = None,
+        on_leave: Callable | None = None,
+        loader: Callable | None = None,
+        on_loaded: Callable | None = None,
+        placeholder: Callable | None = None,
+        save_state: Callable | None = None,
+        restore_state: Callable | None = None,
+    ):
+        self.on_evict      = on_evict
+        self.on_restore    = on_restore
+        self.on_enter      = on_enter
+        self.on_leave      = on_leave
+        self.loader        = loader
+        self.on_loaded     = on_loaded
+        self.placeholder   = placeholder
+        self.save_state    = save_state
+        self.restore_state = restore_state
+
+
+class TransitionReport:
+    """
+    Frame statistics of a single animation.
+
+    Attributes:
+        kind (str): Animation kind: the transition name or "drawer".
+        duration (int): Planned duration in milliseconds.
+        elapsed (float): Measured duration in milliseconds.
+        planned_frames (int): Frames the animation renders on an idle event loop.
+        frames_rendered (int): Frames actually drawn.
+        frames_skipped (int): Planned frames dropped because the loop was behind.
+    """
+    def __init__(self, kind: str, duration: int, planned_frames: int):
+        self.kind            = kind
+        self.duration        = duration
+        self.elapsed         = 0.0
+        self.planned_frames  = planned_frames
+        self.frames_rendered = 0
+        self.frames_skipped  = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"TransitionReport({self.kind!r}, {self.elapsed:.1f}/{self.duration}ms, "
+            f"rendered={self.frames_rendered}, skipped={self.frames_skipped})"
+        )
+
+
+class StartupReport:
+    """
+    Where the time to the first frame of set_screens() went.
+
+    Attributes:
+        module_ms (float): Importing screens_manager itself.
+        toolkit_ms (float): Importing customtkinter on its first use by this
+            module. Close to zero when the app imported it beforehand.
+        screens_ms (float): Clearing old screens and registering the new ones.
+        initial_ms (float): Building and showing the initial (or restored) screen.
+        nav_ms (float): Building the bottom bar or drawer. With defer_nav it
+            is filled in once the deferred build has run.
+        first_frame_ms (float): From the start of set_screens() until the
+            first idle callback after the initial screen was shown.
+        deferred_nav (bool): Whether the nav was built after the first frame.
+    """
+    def __init__(self, deferred_nav: bool):
+        self.module_ms      = _IMPORT_MS.get(__name__, 0.0)
+        self.toolkit_ms     = _IMPORT_MS.get("customtkinter", 0.0)
+        self.screens_ms     = 0.0
+        self.initial_ms     = 0.0
+        self.nav_ms         = 0.0
+        self.first_frame_ms = 0.0
+        self.deferred_nav   = deferred_nav
+
+
+# ─────────────────────────────────────────────
+#  Transition Registry
+# ─────────────────────────────────────────────
+
+EASINGS: dict[str, Callable[[float], float]] = {
+    EASE_LINEAR:    lambda t: t,
+    EASE_OUT:       lambda t: 1 - (1 - t) ** 2,
+    EASE_IN_OUT:    lambda t: 2 * t * t if t < 0.5 else 1 - (2 - 2 * t) ** 2 / 2,
+    EASE_OUT_CUBIC: lambda t: 1 - (1 - t) ** 3,
+}
+
+# Fraction of the size the incoming screen starts at, per slide direction
+_DIRECTION_VECTORS = {
+    SLIDE_LEFT:  (-1, 0),
+    SLIDE_RIGHT: (1, 0),
+    SLIDE_UP:    (0, -1),
+    SLIDE_DOWN:  (0, 1),
+}
+
+
+class Transition(ABC):
+    """
+    Base class of the transitions in the registry, see register_transition().
+
+    Subclasses implement keyframes(). It is called once per combination of
+    easing, frame count, size and direction, and the manager caches the
+    table, so rendering a frame is a lookup plus a place()/configure() call.
+
+    Attributes:
+        kind (str): Engine playing the keyframes. "place" keyframes are
+            (ease, incoming, outgoing) tuples, where incoming and outgoing
+            are place() options of the two screens, or None while a screen
+            rests where the previous keyframe left it. "fade" keyframes are
+            the eased progress of a cross-fade through the screens' colors.
+        easing (str): Default easing, overridden by ScreensManager(easing=...).
+        incoming_on_top (bool): Stacking of the two screens for "place".
+    """
+    kind            = "place"
+    easing          = EASE_OUT
+    incoming_on_top = True
+
+    @abstractmethod
+    def keyframes(self, w: int, h: int, direction: str, frames: int, ease: Callable[[float], float]) -> list:
+        """Returns frames + 1 keyframes for a content area of w x h pixels."""
+
+
+class SlideTransition(Transition):
+    """
+    Moves the screens along the slide direction. `incoming` and `outgoing`
+    scale the distance each screen travels: (1, 1) is a slide, (1, 0) a
+    cover, (0, 1) a reveal and (1, 0.3) a push with parallax.
+    """
+    def __init__(self, incoming: float = 1.0, outgoing: float = 1.0, incoming_on_top: bool = True):
+        self.incoming        = incoming
+        self.outgoing        = outgoing
+        self.incoming_on_top = incoming_on_top
+
+    def keyframes(self, w, h, direction, frames, ease):
+        dx, dy = _DIRECTION_VECTORS.get(direction, _DIRECTION_VECTORS[SLIDE_LEFT])
+        ix, iy = dx * w * self.incoming,  dy * h * self.incoming
+        ox, oy = -dx * w * self.outgoing, -dy * h * self.outgoing
+
+        table = []
+        for i in range(frames + 1):
+            e = ease(i / frames)
+            incoming = {"x": int(ix * (1 - e)), "y": int(iy * (1 - e)), "relwidth": 1, "relheight": 1}
+            outgoing = {"x": int(ox * e), "y": int(oy * e), "relwidth": 1, "relheight": 1}
+            # Resting screens are only placed by the first keyframe
+            if i and not self.incoming:
+                incoming = None
+            if i and not self.outgoing:
+                outgoing = None
+            table.append((e, incoming, outgoing))
+        return table
+
+
+class ScaleTransition(Transition):
+    """
+    Grows the incoming screen from `start` of the content size to its full
+    size, centered over the resting outgoing screen. Tk cannot scale
+    widgets, so the screen's layout is resized rather than zoomed.
+    """
+    def __init__(self, start: float = 0.85):
+        self.start = start
+
+    def keyframes(self, w, h, direction, frames, ease):
+        table = []
+        for i in range(frames + 1):
+            e      = ease(i / frames)
+            scale  = self.start + (1 - self.start) * e
+            offset = (1 - scale) / 2
+            incoming = {"x": 0, "y": 0, "relx": offset, "rely": offset, "relwidth": scale, "relheight": scale}
+            outgoing = {"x": 0, "y": 0, "relwidth": 1, "relheight": 1} if i == 0 else None
+            table.append((e, incoming, outgoing))
+        return table
+
+
+class FadeTransition(Transition):
+    """Cross-fade through the screens' background colors, see ScreensManager._fade."""
+    kind   = "fade"
+    easing = EASE_LINEAR
+
+    def keyframes(self, w, h, direction, frames, ease):
+        return [ease(i / frames) for i in range(frames + 1)]
+
+
+TRANSITIONS: dict[str, Transition] = {
+    TRANSITION_FADE:   FadeTransition(),
+    TRANSITION_SLIDE:  SlideTransition(),
+    TRANSITION_COVER:  SlideTransition(incoming=1.0, outgoing=0.0),
+    TRANSITION_REVEAL: SlideTransition(incoming=0.0, outgoing=1.0, incoming_on_top=False),
+    TRANSITION_PUSH:   SlideTransition(incoming=1.0, outgoing=0.3),
+    TRANSITION_SCALE:  ScaleTransition(),
+}
+
+
+def register_transition(name: str, transition: Transition):
+    """Makes a transition available to navigate(transition=name)."""
+    if not isinstance(transition, Transition):
+        raise TypeError(f"Expected a Transition instance, got {type(transition).__name__}.")
+    if name == TRANSITION_NONE:
+        raise ValueError(f"'{TRANSITION_NONE}' is reserved for instant switches.")
+    if transition.easing not in EASINGS:
+        raise ValueError(f"Unknown easing '{transition.easing}'. Register it with register_easing() first.")
+    TRANSITIONS[name] = transition
+
+
+def register_easing(name: str, func: Callable[[float], float]):
+    """Makes an easing curve, mapping progress 0..1 to 0..1, available by name."""
+    EASINGS[name] = func
+
+
+def _check_animation(transition: str | None, easing: str | None):
+    """Raises ValueError for transition or easing names missing from the registries."""
+    if transition is not None and transition != TRANSITION_NONE and transition not in TRANSITIONS:
+        raise ValueError(f"Unknown transition '{transition}'. Available: {[TRANSITION_NONE, *TRANSITIONS]}")
+    if easing is not None and easing not in EASINGS:
+        raise ValueError(f"Unknown easing '{easing}'. Available: {list(EASINGS)}")
+
+
+class _AnimationClock:
+    """
+    Monotonic clock driving an animation.
+
+    Progress is derived from the time elapsed since the start, so a late frame
+    jumps ahead instead of stretching the animation.
+    """
+    def __init__(self, kind: str, duration: int):
+        self.duration = max(1, duration)
+        self.frames   = max(10, self.duration // FRAME_MS)
+        self.frame_ms = self.duration / self.frames
+        self.start    = time.perf_counter()
+        self.report   = TransitionReport(kind, duration, self.frames)
+
+    def elapsed(self) -> float:
+        """Milliseconds since the animation started."""
+        return (time.perf_counter() - self.start) * 1000
+
+    def tick(self) -> float:
+        """Counts a rendered frame and returns the current progress in [0, 1]."""
+        self.report.frames_rendered += 1
+        return min(1.0, self.elapsed() / self.duration)
+
+    def finish(self) -> TransitionReport:
+        """Finalizes and returns the report."""
+        report = self.report
+        report.elapsed        = self.elapsed()
+        report.frames_skipped = max(0, report.planned_frames - report.frames_rendered)
+        return report
+
+
+class Tween:
+    """
+    A single animation advanced by an AnimationScheduler.
+
+    Attributes:
+        kind (str): Animation kind, used for the TransitionReport.
+        owner (object): Object that started the tween, e.g. a ScreensManager.
+        report (TransitionReport): Frame statistics of this tween.
+        done (bool): True once the tween has finished or been cancelled.
+    """
+    def __init__(
+        self,
+        kind: str,
+        duration: int,
+        update: Callable[[float], None],
+        on_done: Callable | None = None,
+        on_cancel: Callable | None = None,
+        owner: object = None,
+    ):
+        self.kind      = kind
+        self.owner     = owner
+        self.update    = update
+        self.on_done   = on_done
+        self.on_cancel = on_cancel
+        self.clock     = _AnimationClock(kind, duration)
+        self.report    = self.clock.report
+        self.done      = False
+
+    def step(self):
+        """Renders the frame for the current time and finishes at the end."""
+        if self.done:
+            return
+        progress = self.clock.tick()
+        self.update(progress)
+        if progress >= 1:
+            self._complete(self.on_done)
+
+    def finish(self):
+        """Jumps to the final frame and runs on_done."""
+        if self.done:
+            return
+        self.update(1.0)
+        self._complete(self.on_done)
+
+    def cancel(self):
+        """Stops the tween where it is and runs on_cancel."""
+        if self.done:
+            return
+        self._complete(self.on_cancel)
+
+    def _complete(self, callback):
+        self.done = True
+        self.clock.finish()
+        if callback:
+            callback(self)
+
+
+class AnimationScheduler:
+    """
+    Advances all active tweens from a single per-frame tick.
+
+    Several ScreensManager instances (e.g. nested regions) can share one
+    scheduler, so that every geometry update of a frame happens in one tick.
+    """
+    def __init__(self, root, frame_ms: int = FRAME_MS):
+        self.root     = root
+        self.frame_ms = frame_ms
+        self._tweens: list[Tween] = []
+        self._after_id = None
+
+    @property
+    def active(self) -> list[Tween]:
+        """The tweens that are currently running."""
+        return [t for t in self._tweens if not t.done]
+
+    def start(
+        self,
+        kind: str,
+        duration: int,
+        update: Callable[[float], None],
+        on_done: Callable | None = None,
+        on_cancel: Callable | None = None,
+        owner: object = None,
+    ) -> Tween:
+        """Creates a tween, renders its first frame and schedules the rest."""
+        tween = Tween(kind, duration, update, on_done, on_cancel, owner)
+        self._tweens.append(tween)
+        self._step(tween)
+        self._ensure_ticking()
+        return tween
+
+    def finish(self, owner: object = None):
+        """Jumps all tweens (optionally only those of one owner) to their end."""
+        for tween in self._select(owner):
+            tween.finish()
+
+    def cancel(self, owner: object = None):
+        """Stops all tweens (optionally only those of one owner)."""
+        for tween in self._select(owner):
+            tween.cancel()
+
+    def _select(self, owner) -> list[Tween]:
+        return [t for t in self._tweens if not t.done and (owner is None or t.owner is owner)]
+
+    def _ensure_ticking(self):
+        self._tweens = [t for t in self._tweens if not t.done]
+        if self._tweens and self._after_id is None:
+            self._after_id = self.root.after(self.frame_ms, self._tick)
+
+    def _tick(self):
+        """Advances every active tween by one frame."""
+        start = time.perf_counter()
+
+        # Cleared first so the loop can always be restarted. Tweens started
+        # from on_done render on their own and may already schedule the next tick
+        self._after_id = None
+        for tween in list(self._tweens):
+            self._step(tween)
+
+        self._tweens = [t for t in self._tweens if not t.done]
+        if self._tweens and self._after_id is None:
+            cost = (time.perf_counter() - start) * 1000
+            self._after_id = self.root.after(max(1, int(self.frame_ms - cost)), self._tick)
+
+    def _step(self, tween: Tween):
+        """Steps one tween. A failing tween is cancelled and reported, the others keep running."""
+        try:
+            tween.step()
+        except Exception as error:
+            try:
+                tween.cancel()
+            except Exception:
+                tween.done = True
+            self.root._root().report_callback_exception(type(error), error, error.__traceback__)
+
+
+class NavigationMetrics:
+    """
+    Rolling navigation and drawer timings collected by a ScreensManager.
+
+    Each record is a dict with an "event" key ("navigate", "drawer_open" or
+    "drawer_close") and numeric values (milliseconds or frame counts). The
+    last `window` values of every numeric key are kept for stats().
+
+    A listener that raises does not stop the other listeners. Its exception
+    is passed to `on_error`, or re-raised once all listeners ran if no
+    `on_error` is given.
+    """
+    def __init__(self, window: int = 200, on_error: Callable[[BaseException], None] | None = None):
+        self.window   = window
+        self.on_error = on_error
+        self._samples:   dict[str, deque[float]] = {}
+        self._listeners: list[Callable[[dict], None]] = []
+
+    def add_listener(self, callback: Callable[[dict], None]):
+        """Registers a callback receiving every finished record."""
+        self._listeners.append(callback)
+
+    def add(self, record: dict):
+        """Stores the numeric values of a record and notifies listeners."""
+        for key, value in record.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                samples = self._samples.get(key)
+                if samples is None:
+                    samples = self._samples[key] = deque(maxlen=self.window)
+                samples.append(value)
+
+        failed = None
+        for callback in self._listeners:
+            try:
+                callback(record)
+            except Exception as error:
+                if self.on_error is None:
+                    failed = failed or error
+                else:
+                    self.on_error(error)
+        if failed is not None:
+            raise failed
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Returns count, mean, p50, p90, p99 and max of every metric."""
+        result = {}
+        for key, samples in self._samples.items():
+            ordered = sorted(samples)
+            count   = len(ordered)
+            result[key] = {
+                "count": count,
+                "mean":  sum(ordered) / count,
+                "p50":   self._percentile(ordered, 50),
+                "p90":   self._percentile(ordered, 90),
+                "p99":   self._percentile(ordered, 99),
+                "max":   ordered[-1],
+            }
+        return result
+
+    def reset(self):
+        """Drops all collected samples."""
+        self._samples.clear()
+
+    @staticmethod
+    def _percentile(ordered: list[float], pct: int) -> float:
+        """Nearest-rank percentile of an already sorted list."""
+        index = max(0, -(-len(ordered) * pct // 100) - 1)
+        return ordered[index]
+
+
+class _BackgroundRunner:
+    """
+    Runs work off the Tk thread and hands the results back to it.
+
+    Plain callables run on a thread pool, coroutine functions on an asyncio
+    loop in a daemon thread. Finished futures are queued and delivered to the
+    Tk thread in batches by a single `after` loop that only runs while work is
+    outstanding.
+    """
+    def __init__(self, root, max_workers: int = 4):
+        self.root        = root
+        self.max_workers = max_workers
+        self._executor: futures.ThreadPoolExecutor | None = None
+        self._loop:     asyncio.AbstractEventLoop | None = None
+        self._results:  queue.SimpleQueue = queue.SimpleQueue()
+        self._outstanding = 0
+        self._after_id    = None
+
+    def submit(self, func: Callable, *args, callback=None, errback=None) -> futures.Future:
+        """
+        Starts func(*args) in the background. callback(result) or
+        errback(exception) is then called on the Tk thread, unless the
+        future was cancelled.
+        """
+        if inspect.iscoroutinefunction(func):
+            future = asyncio.run_coroutine_threadsafe(func(*args), self._ensure_loop())
+        else:
+            future = self._ensure_executor().submit(func, *args)
+
+        self._outstanding += 1
+        future.add_done_callback(lambda f: self._results.put((f, callback, errback)))
+        if self._after_id is None:
+            self._after_id = self.root.after(FRAME_MS, self._deliver)
+        return future
+
+    def shutdown(self):
+        """Stops the worker threads. Pending results are dropped."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+
+    def _ensure_executor(self) -> futures.ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = futures.ThreadPoolExecutor(self.max_workers, thread_name_prefix="screens_manager")
+        return self._executor
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, name="screens_manager_asyncio", daemon=True).start()
+        return self._loop
+
+    def _deliver(self):
+        """Tk thread: hands every finished future to its callbacks."""
+        self._after_id = None
+        while True:
+            try:
+                future, callback, errback = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._outstanding -= 1
+            if future.cancelled():
+                continue
+
+            # A raising callback must not strand the results queued after it
+            try:
+                error = future.exception()
+                if error is not None:
+                    if errback:
+                        errback(error)
+                elif callback:
+                    callback(future.result())
+            except Exception as error:
+                self.root._root().report_callback_exception(type(error), error, error.__traceback__)
+
+        if self._outstanding > 0 and self._after_id is None:
+            self._after_id = self.root.after(FRAME_MS, self._deliver)
+
+
+class _VirtualList:
+    """
+    Scrollable list of nav buttons that only keeps enough buttons to fill its
+    viewport plus a margin. Buttons are recycled: scrolling rebinds them to
+    other items instead of creating new ones.
+
+    The owner provides the callbacks: create() returns a new button,
+    bind(button, item) shows an item on a button, unbind(item) is called when
+    an item scrolls out of view and place(button, position) positions a
+    button at the given pixel offset along the list.
+    """
+    def __init__(
+        self,
+        parent,
+        items: list,
+        orientation: str,
+        item_size: int,
+        create: Callable,
+        bind: Callable,
+        unbind: Callable,
+        place: Callable,
+        margin: int = 2,
+        scrollbar_kw: dict | None = None,
+        **viewport_kw,
+    ):
+        self.items       = items
+        self.orientation = orientation
+        self.item_size   = item_size
+        self.margin      = margin
+        self.offset      = 0
+        self._create = create
+        self._bind   = bind
+        self._unbind = unbind
+        self._place  = place
+        self._pool:  list = []
+        self._bound: dict[int, tuple] = {}   # index -> (button, item)
+
+        self.frame    = ctk.CTkFrame(parent, fg_color="transparent", corner_radius=0)
+        self.viewport = ctk.CTkFrame(self.frame, fg_color="transparent", corner_radius=0, **viewport_kw)
+        self.scrollbar = ctk.CTkScrollbar(
+            self.frame, orientation=orientation, command=self._on_scrollbar, **(scrollbar_kw or {})
+        )
+        if orientation == "horizontal":
+            self.viewport.pack(side="top", fill="both", expand=True)
+            self.scrollbar.pack(side="bottom", fill="x")
+        else:
+            self.viewport.pack(side="left", fill="both", expand=True)
+            self.scrollbar.pack(side="right", fill="y")
+
+        self.viewport.bind("<Configure>", lambda _: self.refresh())
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.viewport.bind(sequence, self._on_wheel)
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def set_items(self, items: list):
+        """Replaces the items, rebinding every visible button."""
+        for index in list(self._bound):
+            self._release(index)
+        self.items = items
+        self.refresh()
+
+    def refresh(self):
+        """Binds and places the buttons of the items inside the viewport."""
+        size  = self._viewport_size()
+        total = len(self.items) * self.item_size
+        self.offset = max(0, min(self.offset, total - size))
+
+        first  = max(0, self.offset // self.item_size - self.margin)
+        last   = min(len(self.items), (self.offset + size) // self.item_size + 1 + self.margin)
+        wanted = range(first, last)
+
+        for index in [i for i in self._bound if i not in wanted]:
+            self._release(index)
+
+        for index in wanted:
+            entry = self._bound.get(index)
+            if entry is None:
+                button = self._pool.pop() if self._pool else self._new_button()
+                item   = self.items[index]
+                self._bind(button, item)
+                entry = self._bound[index] = (button, item)
+            self._place(entry[0], index * self.item_size - self.offset)
+
+        if total > 0:
+            self.scrollbar.set(self.offset / total, min(1.0, (self.offset + size) / total))
+
+    def _release(self, index: int):
+        button, item = self._bound.pop(index)
+        button.place_forget()
+        self._unbind(item)
+        self._pool.append(button)
+
+    def _new_button(self):
+        button = self._create(self.viewport)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            button.bind(sequence, self._on_wheel)
+        return button
+
+    def _viewport_size(self) -> int:
+        """Viewport length in unscaled units, like item_size and place() offsets."""
+        if self.orientation == "horizontal":
+            size = self.viewport.winfo_width()
+        else:
+            size = self.viewport.winfo_height()
+        return max(1, int(size / ctk.ScalingTracker.get_widget_scaling(self.viewport)))
+
+    def _on_scrollbar(self, action, value, unit=None):
+        total = len(self.items) * self.item_size
+        if action == "moveto":
+            self.offset = int(float(value) * total)
+        else:
+            step = self.item_size if unit == "units" else self._viewport_size()
+            self.offset += int(value) * step
+        self.refresh()
+
+    def _on_wheel(self, event):
+        if event.num == 4:
+            delta = -1
+        elif event.num == 5:
+            delta = 1
+        else:
+            delta = -1 if event.delta > 0 else 1
+        self.offset += delta * self.item_size
+        self.refresh()
+
+
+class _QualityState:
+    """
+    Adaptive transition quality of one destination screen.
+
+    `level` counts the steps down the quality ladder, `samples` holds the
+    mean frame intervals (ms) of the last transitions to the screen and
+    `good` counts transitions in a row that stayed well within budget.
+    """
+    def __init__(self):
+        self.level   = 0
+        self.samples: deque[float] = deque(maxlen=3)
+        self.good    = 0
+
+
+class _DetachedScreen:
+    """
+    Appearance callbacks of a hidden screen's widgets, taken out of
+    customtkinter's AppearanceModeTracker while the screen is hidden.
+    `mode` is the appearance mode all widgets are colored for, or None once
+    a recolor pass has started and the widgets are mixed; callbacks[:position]
+    are already colored for the current mode.
+    """
+    def __init__(self, callbacks: list[Callable], mode: str | None):
+        self.callbacks = callbacks
+        self.mode      = mode
+        self.position  = 0
 
 
 class ScreensManager:
@@ -170,34 +1014,227 @@ class ScreensManager:
         nav_items: list[NavItem] | None = None,
         bottom_bar_style: BottomBarStyle | None = None,
         drawer_style: DrawerStyle | None = None,
+        max_live_screens: int | None = None,
+        max_widgets: int | None = None,
+        scheduler: AnimationScheduler | None = None,
+        slide_proxy: bool = False,
+        busy_policy: str = BUSY_DROP,
+        metrics: bool = False,
+        max_workers: int = 4,
+        prewarm: bool = False,
+        prewarm_budget_ms: float = 8,
+        prewarm_limit: int = 2,
+        history_size: int = 50,
+        session_path: str | None = None,
+        session_delay: int = 500,
+        defer_nav: bool = False,
+        freeze_on_resize: bool = False,
+        resize_settle_ms: int = 150,
+        lazy_appearance: bool = False,
+        adaptive_quality: bool = False,
+        frame_budget_ms: float = FRAME_MS * 1.5,
+        easing: str | None = None,
     ):
         """
         Initializes the ScreensManager.
 
         Args:
             root: The main CTk window.
-            transition: Default transition type (fade, slide, none).
+            transition: Default transition: none or a name registered in
+                TRANSITIONS (fade, slide, cover, reveal, push, scale, …).
             direction: Default slide direction.
             duration: Animation duration in ms.
             nav_mode: Type of built-in navigation to use.
             nav_items: List of NavItem objects for the navigation menu.
             bottom_bar_style: Custom style for the Bottom Bar.
             drawer_style: Custom style for the Navigation Drawer.
+            max_live_screens: Maximum number of built screens kept alive.
+                Least-recently-navigated hidden screens that have a factory
+                are destroyed beyond this limit and rebuilt when needed.
+            max_widgets: Same as max_live_screens, but as a budget on the
+                total number of widgets across all built screens.
+            scheduler: Animation scheduler to share with other managers.
+                A new one is created by default.
+            slide_proxy: Slide lightweight placeholder frames instead of the
+                real screens, which are only gridded in once the slide ends.
+                Keeps slides smooth on screens with many widgets.
+            busy_policy: What to do with navigations requested while a
+                transition runs (drop, queue, latest, interrupt).
+            metrics: Record navigation and drawer timings, see metrics_stats().
+            max_workers: Size of the thread pool used for threaded callbacks.
+            prewarm: Build the screens most likely to be visited next during
+                idle time: the nav_items neighbors of the current screen and
+                the most frequent destinations from it.
+            prewarm_budget_ms: Time budget of a single idle prewarm or
+                recolor slice.
+            prewarm_limit: Maximum number of prewarmed screens that have not
+                been visited yet. max_live_screens is never exceeded.
+            history_size: Maximum depth of the back and forward history.
+                The oldest entries are dropped beyond it.
+            session_path: JSON file the session (current screen, history,
+                drawer state, bar scroll offset and save_state results) is
+                saved to after navigations and restored from by set_screens().
+            session_delay: Delay in ms by which session writes are coalesced.
+            defer_nav: Let set_screens() show the initial screen first and
+                build the bottom bar or drawer in an idle callback right after.
+            freeze_on_resize: While the window is being resized, replace the
+                current screen by a plain frame of its color and lay it out
+                once, when the resize has settled.
+            resize_settle_ms: Time without resize events after which a resize
+                counts as settled.
+            lazy_appearance: Keep hidden screens out of appearance mode
+                changes. Only the visible screen and the nav are recolored
+                right away; hidden screens are recolored in idle slices or
+                right before they are shown.
+            adaptive_quality: Track the frame interval of transitions per
+                destination screen and degrade them (slide, fade, coarse
+                fade, none) while it exceeds frame_budget_ms. Transitions
+                are upgraded again once frames recover.
+            frame_budget_ms: Mean frame interval above which a transition
+                counts as too slow.
+            easing: Default easing curve, a name registered in EASINGS.
+                Each transition uses its own default when None.
         """
+        _check_animation(transition, easing)
+
+        # Nav Button Cache, reset by the nav_items and style setters
+        self._nav_index:  dict[str, NavItem] | None            = None
+        self._nav_kw:     dict[tuple[str, str], tuple[dict, dict]] = {}
+        self._nav_active: str | None                            = None
+        # Original values of the keys items set on recycled (virtualized) buttons
+        self._recycled_kw: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
         self.root       = root
         self.transition = transition
         self.direction  = direction
         self.duration   = duration
+        self.easing     = easing
         self.nav_mode   = nav_mode
         self.nav_items  = nav_items or []
 
         self.bottom_bar_style = bottom_bar_style or BottomBarStyle()
         self.drawer_style     = drawer_style     or DrawerStyle()
 
+        self.max_live_screens = max_live_screens
+        self.max_widgets      = max_widgets
+
+        self.scheduler   = scheduler or AnimationScheduler(root)
+        self.slide_proxy = slide_proxy
+        self.busy_policy = busy_policy
+        self._metrics    = NavigationMetrics(on_error=self._report_error) if metrics else None
+
+        self.prewarm           = prewarm
+        self.prewarm_budget_ms = prewarm_budget_ms
+        self.prewarm_limit     = prewarm_limit
+
         self.__screens: dict[str, ctk.CTkFrame] = {}
+        self.__factories: dict[str, Callable | None] = {}
+        self.__hooks: dict[str, ScreenHooks] = {}
+        # Screens whose name is taken by the manager itself: not set as attributes
+        self._unattached: set[str] = set()
         self.current: str | None = None
-        self._on_navigate_callbacks: list = []
+        self._on_navigate_callbacks: list[tuple[Callable, str, Callable | None]] = []
+        self._deferred_calls: list[tuple[Callable, str]] = []
+        self._background = _BackgroundRunner(root, max_workers)
         self._animating = False
+        self._settling  = False
+
+        # Navigations requested during a transition, see busy_policy
+        self._pending: deque[tuple[str, Callable]] = deque()
+        self._moving_in     = None
+        self._retarget_from: tuple[int, int] | None = None
+
+        # Metrics records of the running navigation and drawer animation
+        self._nav_record:    dict | None = None
+        self._drawer_record: dict | None = None
+
+        # Frame statistics of the most recent screen and drawer animations
+        self.last_transition:        TransitionReport | None = None
+        self.last_drawer_transition: TransitionReport | None = None
+        self._transition_tween: Tween | None = None
+        self._drawer_tween:     Tween | None = None
+        self._proxies: tuple[tk.Frame, tk.Frame] | None = None
+
+        # Fade color ramps, cleared whenever the appearance mode changes
+        self._ramp_cache: dict[tuple[str, str, int], list[str]] = {}
+        self._ramp_mode:  str | None = None
+
+        # Keyframe tables of recent (transition, easing, frames, size, direction) combinations
+        self._keyframe_cache: OrderedDict[tuple, list] = OrderedDict()
+
+        # Eviction Internal State
+        # _recency holds built screens from least to most recently navigated
+        self._recency:       OrderedDict[str, None] = OrderedDict()
+        self._widget_counts: dict[str, int]         = {}
+        self._evicted_state: dict[str, object]      = {}
+        self._leaving:       str | None             = None
+
+        # Prewarming Internal State
+        # _building holds factories that returned a generator and are not exhausted yet
+        self._building:    dict[str, Iterator] = {}
+        self._prewarmed:   set[str]            = set()
+        self._transitions: dict[str, Counter]  = {}
+        self._prewarm_id = None
+
+        # History Internal State
+        # Entries are (screen, direction, state) from oldest to newest
+        self._back_stack:    deque[tuple[str, str, object]] = deque(maxlen=history_size)
+        self._forward_stack: deque[tuple[str, str, object]] = deque(maxlen=history_size)
+        self._history_step:  tuple[str, object] | None      = None
+
+        # Session Internal State
+        # _session_states holds restored states of screens not shown since,
+        # _session_chrome the restored (bar_scroll, drawer_open) until applied
+        self.session_path  = session_path
+        self.session_delay = session_delay
+        self._session_states:  dict[str, object] = {}
+        self._session_chrome:  tuple[float, bool] | None = None
+        self._session_save_id  = None
+        self._session_seq      = 0
+        self._session_written  = 0
+        self._session_lock     = threading.Lock()
+
+        # Startup Internal State, see set_screens()
+        self.defer_nav = defer_nav
+        self.last_startup: StartupReport | None = None
+        self._nav_build_id = None
+
+        # Resize Internal State
+        # _content_size is the coalesced size of _content_frame read by running slides
+        self.freeze_on_resize = freeze_on_resize
+        self.resize_settle_ms = resize_settle_ms
+        self._content_size:    tuple[int, int] | None = None
+        self._resize_size:     tuple[int, int] | None = None
+        self._resize_last      = 0.0
+        self._resize_events    = 0
+        self._resize_frame_id  = None
+        self._frozen:          str | None      = None
+        self._freeze_proxy:    tk.Frame | None = None
+
+        # Appearance Internal State, see lazy_appearance
+        self.lazy_appearance = lazy_appearance
+        self._detached:   dict[str, _DetachedScreen] = {}
+        self._detach_id   = None
+        self._recolor_id  = None
+        if lazy_appearance:
+            ctk.AppearanceModeTracker.add(self._on_appearance_change)
+
+        # Adaptive Quality Internal State
+        # _quality_sample is the (screen, state) whose running transition is measured
+        self.adaptive_quality = adaptive_quality
+        self.frame_budget_ms  = frame_budget_ms
+        self._quality:          dict[str, _QualityState] = {}
+        self._quality_override: dict[str, str]           = {}
+        self._quality_sample:   tuple[str, _QualityState] | None = None
+
+        # Nested managers mounted in screens of this one, see mount()
+        self._children: dict[str, ScreensManager] = {}
+
+        # Screen Lifecycle Internal State
+        self._entered:      str | None          = None
+        self._loads:        dict[str, futures.Future] = {}
+        self._load_tokens:  dict[str, object]   = {}
+        self._placeholders: dict[str, tk.Misc]  = {}
 
         # Drawer Internal State
         self._drawer_frame:   ctk.CTkFrame          | None = None
@@ -206,10 +1243,20 @@ class ScreensManager:
         self._drawer_open     = False
         self._drawer_buttons: dict[str, ctk.CTkButton] = {}
         self._hamburger_btn:  ctk.CTkButton | None = None
+
+        # Swipe Internal State
+        # _swipe_samples holds recent (time, x_root) pointer positions for the fling velocity
+        self._swipe_bound     = False
         self._swipe_start_x   = 0
+        self._swipe_from      = None      # Drawer x when the drag started, None if not dragging
+        self._swipe_tracking  = False
+        self._swipe_x         = 0
+        self._swipe_samples:  deque[tuple[float, int]] = deque(maxlen=6)
+        self._swipe_frame_id  = None
 
         # Bottom Bar Internal State
         self._bottom_bar: ctk.CTkFrame | None = None
+        self._bar_scroll: ctk.CTkScrollableFrame | _VirtualList | None = None
         self._bar_buttons: dict[str, ctk.CTkButton] = {}
 
         # Base Layout Configuration
@@ -218,57 +1265,468 @@ class ScreensManager:
         self._content_frame.grid(row=0, column=0, sticky=ctk.NSEW)
         self._content_frame.grid_rowconfigure(0, weight=1)
         self._content_frame.grid_columnconfigure(0, weight=1)
+        # Bound on the Tk frame itself, next to CTkFrame's own handler
+        tk.Misc.bind(self._content_frame, "<Configure>", self._on_content_configure, "+")
 
         self.root.grid_rowconfigure(0, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
 
+    # ──────────────────────────────────────────────────────────────────────
+    #  Navigation Configuration
+    # ──────────────────────────────────────────────────────────────────────
+
+    @property
+    def nav_items(self) -> list[NavItem]:
+        """Items of the Bottom Bar or Drawer."""
+        return self._nav_items
+
+    @nav_items.setter
+    def nav_items(self, items: list[NavItem]):
+        self._nav_items = items
+        self._invalidate_nav_cache()
+
+    @property
+    def bottom_bar_style(self) -> BottomBarStyle:
+        """Style of the Bottom Bar."""
+        return self._bottom_bar_style
+
+    @bottom_bar_style.setter
+    def bottom_bar_style(self, style: BottomBarStyle):
+        self._bottom_bar_style = style
+        self._invalidate_nav_cache()
+
+    @property
+    def drawer_style(self) -> DrawerStyle:
+        """Style of the Navigation Drawer."""
+        return self._drawer_style
+
+    @drawer_style.setter
+    def drawer_style(self, style: DrawerStyle):
+        self._drawer_style = style
+        self._invalidate_nav_cache()
+
+    def refresh_nav_styles(self):
+        """
+        Re-applies the styles of all nav buttons. Call this after changing a
+        NavItem or a style object in place.
+        """
+        self._invalidate_nav_cache()
+        for kind, buttons in (("bar", self._bar_buttons), ("drawer", self._drawer_buttons)):
+            for screen, btn in buttons.items():
+                kwargs = self._nav_kwargs(kind, screen)
+                if kwargs is None:
+                    continue
+                base_kw, active_kw = kwargs
+                try: btn.configure(**(active_kw if screen == self.current else base_kw))
+                except: pass
+        self._nav_active = self.current
+
+    def _invalidate_nav_cache(self):
+        """Drops the cached item index and button kwargs."""
+        self._nav_index = None
+        self._nav_kw.clear()
+
+    def _nav_item(self, screen: str) -> NavItem | None:
+        """Returns the NavItem of a screen through a lazily built index."""
+        if self._nav_index is None:
+            self._nav_index = {item.screen: item for item in self.nav_items}
+        return self._nav_index.get(screen)
+
+    def _nav_kwargs(self, kind: str, screen: str) -> tuple[dict, dict] | None:
+        """Returns the cached (base, active) button kwargs of a bar or drawer item."""
+        key = (kind, screen)
+        kwargs = self._nav_kw.get(key)
+        if kwargs is not None:
+            return kwargs
+
+        item = self._nav_item(screen)
+        if item is None:
+            return None
+
+        if kind == "bar":
+            s    = self.bottom_bar_style
+            text = self._resolve_button_text(item, s.layout, s.icon_font, s.label_font)
+        else:
+            text = self._resolve_drawer_text(item, self.drawer_style.layout)
+
+        # Keys only set by the active style fall back to the theme when inactive,
+        # so a deactivated (or recycled) button does not keep the active look
+        base_kw  = {"text": text, **item.style}
+        defaults = ctk.ThemeManager.theme.get("CTkButton", {})
+        for key in item.active_style:
+            if key not in base_kw and key in defaults:
+                base_kw[key] = defaults[key]
+
+        # Without an active style both states share one dict and need no reconfigure
+        active_kw = {**base_kw, **item.active_style} if item.active_style else base_kw
+
+        self._nav_kw[key] = kwargs = (base_kw, active_kw)
+        return kwargs
+
     # ──────────────────────────────────────────────────────────────────────
     #  Screen Management
     # ──────────────────────────────────────────────────────────────────────
 
-    def set_screens(self, *names: str, initial: str | None = None):
+    def set_screens(
+        self,
+        *names: str,
+        initial: str | None = None,
+        factories: dict[str, Callable] | None = None,
+        hooks: dict[str, ScreenHooks] | None = None,
+    ):
         """
         Initializes the stack of screens. Replaces any existing screens.
 
         Args:
             *names: Variable list of screen names.
             initial: The name of the screen to display first.
+            factories: Optional mapping of screen name to a callable that
+                populates the screen frame. Screens with a factory are built
+                lazily, the first time they are navigated to or accessed.
+            hooks: Optional mapping of screen name to its ScreenHooks.
         """
-        # Automatically extract names from nav_items if names are not provided
+        factories = factories or {}
+        hooks     = hooks     or {}
+
+        # Automatically extract names from nav_items (or factories) if names are not provided
         if not names and self.nav_items:
             names = tuple(item.screen for item in self.nav_items)
+        if not names and factories:
+            names = tuple(factories)
 
         if not names:
             raise ValueError("Provide at least one screen name or define nav_items.")
         if initial and initial not in names:
             raise ValueError(f"Initial screen '{initial}' not found in provided names.")
 
-        # Cleanup existing attributes and widgets
+        started = time.perf_counter()
+        report  = self.last_startup = StartupReport(deferred_nav=self.defer_nav)
+        if self._nav_build_id is not None:
+            self.root.after_cancel(self._nav_build_id)
+            self._nav_build_id = None
+
+        # Cleanup existing attributes and widgets. Running tweens would
+        # otherwise keep stepping frames that are about to be destroyed
+        self._pending.clear()
+        self._settle_animations()
+        self._thaw()
         for name in list(self.__screens.keys()):
-            if hasattr(self, name):
+            if name in self.__dict__ and name not in self._unattached:
                 delattr(self, name)
         for screen in self.__screens.values():
             screen.destroy()
         self.__screens.clear()
+        self.__factories.clear()
+        self.__hooks.clear()
+        self._unattached.clear()
+        self._recency.clear()
+        self._widget_counts.clear()
+        self._evicted_state.clear()
+        self.current  = None
+        self._leaving = None
+        self._entered = None
+        self._building.clear()
+        self._prewarmed.clear()
+        self._transitions.clear()
+        self._children.clear()
+        self._pending.clear()
+        self._back_stack.clear()
+        self._forward_stack.clear()
+        self._session_states.clear()
+        self._session_chrome = None
+        self._detached.clear()
+        self._quality.clear()
+        self._quality_override.clear()
+        for future in self._loads.values():
+            future.cancel()
+        self._loads.clear()
+        self._load_tokens.clear()
+        self._placeholders.clear()
 
         for name in names:
-            self.add_screen(name)
+            self.add_screen(name, factory=factories.get(name), hooks=hooks.get(name))
+        report.screens_ms = (time.perf_counter() - started) * 1000
 
-        self._build_nav()
+        if not self.defer_nav:
+            nav_started = time.perf_counter()
+            self._build_nav()
+            report.nav_ms = (time.perf_counter() - nav_started) * 1000
 
-        if initial:
+        # A saved session takes precedence over the initial screen
+        initial_started = time.perf_counter()
+        if not (self.session_path is not None and self.restore_session()) and initial:
             self.navigate(initial, transition=TRANSITION_NONE)
+        report.initial_ms = (time.perf_counter() - initial_started) * 1000
+        report.toolkit_ms = _IMPORT_MS.get("customtkinter", 0.0)
+
+        # Queued after the initial screen's redraw, the nav build follows the first frame
+        self.root.after_idle(partial(self._startup_first_frame, report, started))
+        if self.defer_nav:
+            self._nav_build_id = self.root.after_idle(partial(self._build_nav_deferred, report))
+
+    def _startup_first_frame(self, report: StartupReport, started: float):
+        """Idle callback: the initial screen has been drawn."""
+        report.first_frame_ms = (time.perf_counter() - started) * 1000
+
+    def _build_nav_deferred(self, report: StartupReport):
+        """Idle callback building the nav chrome after the first frame."""
+        self._nav_build_id = None
+        started = time.perf_counter()
+        self._build_nav()
+        if self.current is not None:
+            self._update_nav_active(self.current)
+        report.nav_ms = (time.perf_counter() - started) * 1000
+        if self._session_chrome is not None:
+            self.root.after_idle(self._restore_chrome)
+
+    def add_screen(
+        self,
+        name: str,
+        factory: Callable[[ctk.CTkFrame], None] | None = None,
+        hooks: ScreenHooks | None = None,
+    ):
+        """
+        Registers a screen under the given name.
 
-    def add_screen(self, name: str):
-        """Creates a new frame for the given screen name."""
-        if name in self.__screens:
+        Without a factory the frame is created right away and can be populated
+        through attribute access (e.g. ``manager.home``). With a factory, the
+        frame is only created the first time the screen is needed, and the
+        factory is called with it to build the screen's widgets. Only screens
+        with a factory can be evicted. A factory may be a generator function:
+        prewarming then builds the screen in slices, one yield at a time. A
+        factory returning a ScreensManager mounts it, see mount().
+
+        Args:
+            name: Screen name, also used as attribute name on the manager
+                unless the manager already has an attribute or method of that
+                name. Such screens are only reachable through screen(name).
+            factory: Optional callable receiving the new frame.
+            hooks: Optional lifecycle callbacks for this screen.
+        """
+        if name in self.__factories:
             raise ValueError(f"Screen '{name}' already exists.")
-        
+        if hasattr(type(self), name) or name in self.__dict__:
+            self._unattached.add(name)
+
+        self.__factories[name] = factory
+        if hooks is not None:
+            self.__hooks[name] = hooks
+        if factory is None:
+            self._build_screen(name)
+
+    def screen(self, name: str) -> ctk.CTkFrame:
+        """
+        Returns the frame of a screen, building it on demand. Unlike attribute
+        access, this also works for names taken by the manager itself.
+        """
+        if name not in self.__factories:
+            raise KeyError(f"Screen '{name}' does not exist. Available: {list(self.__factories.keys())}")
+        return self._get_screen(name)
+
+    def is_built(self, name: str) -> bool:
+        """Returns True if the frame of the given screen currently exists and is complete."""
+        return name in self.__screens and name not in self._building
+
+    def _build_screen(self, name: str) -> ctk.CTkFrame:
+        """Creates the frame for a registered screen and runs its factory to the end."""
+        frame = self._start_screen(name)
+        work  = self._building.pop(name, None)
+        if work is not None:
+            for _ in work:
+                pass
+        self._finish_screen(name, frame)
+        return frame
+
+    def _start_screen(self, name: str) -> ctk.CTkFrame:
+        """Creates the frame of a screen and calls its factory."""
         frame = ctk.CTkFrame(self._content_frame)
         frame.grid(row=0, column=0, sticky=ctk.NSEW)
         frame.grid_forget()
         self.__screens[name] = frame
-        setattr(self, name, frame)
+
+        factory = self.__factories.get(name)
+        if factory is not None:
+            work = factory(frame)
+            if inspect.isgenerator(work):
+                self._building[name] = work
+            elif isinstance(work, ScreensManager):
+                self.mount(name, work)
+        return frame
+
+    def _finish_screen(self, name: str, frame: ctk.CTkFrame):
+        """Publishes a fully built screen."""
+        if name not in self._unattached:
+            setattr(self, name, frame)
+
+        # Hand saved state back to a screen rebuilt after eviction
+        if name in self._evicted_state:
+            state = self._evicted_state.pop(name)
+            hooks = self.__hooks.get(name)
+            if hooks and hooks.on_restore:
+                hooks.on_restore(frame, state)
+
+        self._recency[name] = None
+        if self.max_widgets is not None:
+            self._widget_counts[name] = self._count_widgets(frame)
+        if name != self.current:
+            self._schedule_detach()
+
+    def _get_screen(self, name: str) -> ctk.CTkFrame:
+        """Returns the frame of a registered screen, building it on demand."""
+        frame = self.__screens.get(name)
+        if frame is None:
+            return self._build_screen(name)
+
+        # Finish a screen that prewarming only partially built
+        work = self._building.pop(name, None)
+        if work is not None:
+            for _ in work:
+                pass
+            self._finish_screen(name, frame)
+        return frame
+
+    # — Prewarming ─────────────────────────────────────────────────────────
+
+    def _prewarm_candidates(self) -> list[str]:
+        """Screens likely to be visited next, most likely first."""
+        candidates = []
+        if self.current is not None:
+            for target, _ in self._transitions.get(self.current, Counter()).most_common(3):
+                candidates.append(target)
+
+            screens = [item.screen for item in self.nav_items]
+            if self.current in screens:
+                index = screens.index(self.current)
+                candidates.extend(screens[max(0, index - 1):index] + screens[index + 1:index + 2])
+
+        return [
+            name for name in dict.fromkeys(candidates)
+            if self.__factories.get(name) is not None and not self.is_built(name)
+        ]
+
+    def _schedule_prewarm(self):
+        if self.prewarm and self._prewarm_id is None:
+            self._prewarm_id = self.root.after_idle(self._prewarm_step)
+
+    def _prewarm_step(self):
+        """Idle slice: builds likely next screens until the time budget is spent."""
+        self._prewarm_id = None
+        if self._animating:
+            return  # Rescheduled once the transition ends
+        if self.scheduler.active:
+            self._prewarm_id = self.root.after(FRAME_MS, self._schedule_prewarm_idle)
+            return
+
+        deadline = time.perf_counter() + self.prewarm_budget_ms / 1000
+        for name in self._prewarm_candidates():
+            if name not in self.__screens:
+                if len(self._prewarmed) >= self.prewarm_limit:
+                    return
+                if self.max_live_screens is not None and len(self.__screens) >= self.max_live_screens:
+                    return
+                frame = self._start_screen(name)
+                self._prewarmed.add(name)
+            else:
+                frame = self.__screens[name]
+
+            # Advance a generator factory one chunk at a time
+            work = self._building.get(name)
+            while work is not None and time.perf_counter() < deadline:
+                try:
+                    next(work)
+                except StopIteration:
+                    work = None
+            if work is None:
+                self._building.pop(name, None)
+                self._finish_screen(name, frame)
+
+            if time.perf_counter() >= deadline:
+                self._schedule_prewarm()
+                return
+
+    def _schedule_prewarm_idle(self):
+        self._prewarm_id = None
+        self._schedule_prewarm()
+
+    # — Eviction ──────────────────────────────────────────────────────────
+
+    def evict_screen(self, name: str):
+        """
+        Destroys the frame of a hidden screen. It is rebuilt through its
+        factory the next time it is needed.
+        """
+        if name == self.current:
+            raise ValueError(f"Cannot evict the current screen '{name}'.")
+        if self.__factories.get(name) is None:
+            raise ValueError(f"Screen '{name}' has no factory and cannot be rebuilt.")
+
+        # The screen may still be sliding or fading out
+        settled = self._animating and name == self._leaving
+        if settled:
+            self._settle_animations()
+
+        frame = self.__screens.pop(name, None)
+        if frame is None:
+            return
+        self._building.pop(name, None)
+        self._prewarmed.discard(name)
+
+        hooks = self.__hooks.get(name)
+        if hooks and hooks.on_evict:
+            self._evicted_state[name] = hooks.on_evict(frame)
+
+        if name not in self._unattached:
+            self.__dict__.pop(name, None)
+        self._recency.pop(name, None)
+        self._widget_counts.pop(name, None)
+        self._children.pop(name, None)
+        self._detached.pop(name, None)
+        frame.destroy()
+        if settled:
+            self._after_transition()
+
+    def _enforce_budget(self):
+        """Evicts least-recently-navigated hidden screens while over budget."""
+        if self.max_live_screens is None and self.max_widgets is None:
+            return
+
+        # Widgets may have been added since the screen was built
+        if self.max_widgets is not None and self._leaving in self.__screens:
+            self._widget_counts[self._leaving] = self._count_widgets(self.__screens[self._leaving])
+
+        candidates = [
+            name for name in self._recency
+            if name != self.current and self.__factories.get(name) is not None
+        ]
+        for name in candidates:
+            if not self._over_budget():
+                break
+            self.evict_screen(name)
+
+    def _over_budget(self) -> bool:
+        """Returns True if the live screens exceed any configured budget."""
+        if self.max_live_screens is not None and len(self.__screens) > self.max_live_screens:
+            return True
+        if self.max_widgets is not None and sum(self._widget_counts.values()) > self.max_widgets:
+            return True
+        return False
+
+    @staticmethod
+    def _count_widgets(frame) -> int:
+        """Counts a frame and all of its descendants."""
+        count, stack = 0, [frame]
+        while stack:
+            widget = stack.pop()
+            count += 1
+            stack.extend(widget.winfo_children())
+        return count
+
+    def __getattr__(self, name: str):
+        # Only called when regular lookup fails: builds lazy screens on first access
+        factories = self.__dict__.get("_ScreensManager__factories")
+        if factories is not None and name in factories:
+            return self._get_screen(name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
     # ──────────────────────────────────────────────────────────────────────
     #  Navigation Logic
@@ -280,47 +1738,932 @@ class ScreensManager:
         transition: str | None = None,
         direction: str | None = None,
         duration: int | None = None,
+        easing: str | None = None,
     ):
         """
         Navigates to a specific screen with optional animation overrides.
 
         Args:
-            name: Destination screen name.
+            name: Destination screen name, or a path through nested managers
+                such as "settings/network/wifi" (see mount()).
             transition: Animation type. Defaults to self.transition.
             direction: Slide direction. Defaults to self.direction.
             duration: Animation duration. Defaults to self.duration.
+            easing: Easing curve. Defaults to self.easing. Unregistered
+                transition or easing names raise ValueError before anything
+                changes.
         """
-        if name not in self.__screens:
-            raise KeyError(f"Screen '{name}' does not exist. Available: {list(self.__screens.keys())}")
+        # Also covers self.transition and self.easing changed after construction
+        _check_animation(transition or self.transition, easing or self.easing)
+        if PATH_SEPARATOR in name:
+            self._navigate_path(name, transition, direction, duration, easing)
+            return
+        if name not in self.__factories:
+            raise KeyError(f"Screen '{name}' does not exist. Available: {list(self.__factories.keys())}")
         
-        if self._animating or name == self.current:
+        if self._animating:
+            self._handle_busy(name, partial(self.navigate, name, transition, direction, duration, easing))
+            return
+        step, self._history_step = self._history_step, None
+        if name == self.current:
             return
+        self._thaw()
+
+        started = time.perf_counter() if self._metrics is not None else None
 
         t  = transition if transition is not None else self.transition
         d  = direction  if direction  is not None else self.direction
         ms = duration   if duration   is not None else self.duration
 
-        incoming = self.__screens[name]
+        self._record_history(step, d)
+        t, steps = self._adapt_transition(name, t)
+
+        incoming = self._get_screen(name)
         outgoing = self.__screens.get(self.current) if self.current else None
+        self._attach_appearance(name)
+
+        state = self._session_states.pop(name, None)
+        if step is not None and step[1] is not None:
+            state = step[1]
+        hooks = self.__hooks.get(name)
+        if state is not None and hooks and hooks.restore_state:
+            self._call_hook(hooks.restore_state, incoming, state)
+
+        self._leaving = self.current
+        self.current  = name
+        self._recency.move_to_end(name)
+        self._prewarmed.discard(name)
+        if self._leaving is not None:
+            self._transitions.setdefault(self._leaving, Counter())[name] += 1
+
+        self._leave_screen(self._leaving)
+        self._start_loader(name, incoming)
+
+        self._dispatch_callbacks(name)
+
+        if started is not None:
+            after_callbacks = time.perf_counter()
+            self._update_nav_active(name)
+            self._nav_record = {
+                "event":         "navigate",
+                "screen":        name,
+                "transition":    t,
+                "callbacks_ms":  (after_callbacks - started) * 1000,
+                "nav_active_ms": (time.perf_counter() - after_callbacks) * 1000,
+            }
+            self.root.after_idle(partial(self._record_first_frame, self._nav_record, "first_frame_ms", started))
+        else:
+            self._update_nav_active(name)
 
-        self.current = name
+        engine = TRANSITIONS.get(t) if t != TRANSITION_NONE else None
+        if engine is None:
+            self._instant(incoming, outgoing)
+        elif engine.kind == "fade":
+            self._fade(engine, t, incoming, outgoing, ms, steps, easing)
+        else:
+            self._place_transition(engine, t, incoming, outgoing, d, ms, easing)
 
-        # Execute registered navigation callbacks
-        for cb in self._on_navigate_callbacks:
-            cb(name)
+    # — Adaptive Quality ──────────────────────────────────────────────────
 
-        self._update_nav_active(name)
+    def set_quality_override(self, screen: str, transition: str | None):
+        """
+        Pins the transition used to navigate to `screen`, bypassing
+        adaptive_quality and the requested transition. None removes the pin.
+        """
+        if screen not in self.__factories:
+            raise KeyError(f"Screen '{screen}' does not exist.")
+        if transition is None:
+            self._quality_override.pop(screen, None)
+        else:
+            self._quality_override[screen] = transition
 
-        if t == TRANSITION_FADE:
-            self._fade(incoming, outgoing, ms)
-        elif t == TRANSITION_SLIDE:
-            self._slide(incoming, outgoing, d, ms)
+    def transition_quality(self, screen: str, transition: str | None = None) -> dict:
+        """
+        Returns the current decision for navigations to `screen` with the
+        given (or default) transition: the transition and fade steps that
+        would be used, the quality level, the recent mean frame interval in
+        ms (None before the first measured transition) and the override.
+        """
+        requested = transition if transition is not None else self.transition
+        state     = self._quality.get(screen)
+        effective, steps = self._quality_choice(screen, requested, state)
+        return {
+            "requested":  requested,
+            "transition": effective,
+            "steps":      steps,
+            "level":      state.level if state else 0,
+            "frame_ms":   sum(state.samples) / len(state.samples) if state and state.samples else None,
+            "override":   self._quality_override.get(screen),
+        }
+
+    def _adapt_transition(self, screen: str, transition: str) -> tuple[str, int | None]:
+        """Picks the transition to `screen` and arms measuring it."""
+        self._quality_sample = None
+        if not self.adaptive_quality and screen not in self._quality_override:
+            return transition, None
+
+        state = self._quality.get(screen)
+        if state is None and screen not in self._quality_override:
+            state = self._quality[screen] = _QualityState()
+        effective, steps = self._quality_choice(screen, transition, state)
+
+        if screen in self._quality_override:
+            return effective, steps
+
+        if effective != TRANSITION_NONE:
+            self._quality_sample = (screen, state)
+        elif state.level:
+            # Instant switches measure nothing: probe the next level after a few
+            state.good += 1
+            if state.good >= 5:
+                state.level -= 1
+                state.good = 0
+        return effective, steps
+
+    def _quality_choice(self, screen, transition, state) -> tuple[str, int | None]:
+        """Transition and fade steps at the screen's quality level."""
+        override = self._quality_override.get(screen)
+        if override is not None:
+            return override, None
+        if not self.adaptive_quality or state is None:
+            return transition, None
+
+        ladder = self._quality_ladder(transition)
+        return ladder[min(state.level, len(ladder) - 1)]
+
+    @staticmethod
+    def _quality_ladder(transition: str) -> list[tuple[str, int | None]]:
+        """Transitions from the requested one down to an instant switch."""
+        if transition == TRANSITION_NONE:
+            return [(TRANSITION_NONE, None)]
+        ladder = [(transition, None)]
+        if transition != TRANSITION_FADE:
+            ladder.append((TRANSITION_FADE, None))
+        ladder += [(TRANSITION_FADE, COARSE_FADE_STEPS), (TRANSITION_NONE, None)]
+        return ladder
+
+    def _update_quality(self):
+        """Moves the measured screen down or up the ladder after a transition."""
+        screen, state = self._quality_sample
+        self._quality_sample = None
+        report = self.last_transition
+        if self.current != screen or report is None or report.frames_rendered < 2:
+            return  # Cancelled right away or superseded
+
+        interval = report.elapsed / report.frames_rendered
+        state.samples.append(interval)
+        if interval > self.frame_budget_ms:
+            # Capped at the bottom of the longest ladder
+            state.level = min(state.level + 1, len(self._quality_ladder(TRANSITION_SLIDE)) - 1)
+            state.good = 0
+            state.samples.clear()
+        elif interval <= self.frame_budget_ms * 0.75:
+            state.good += 1
+            if state.good >= 3 and state.level:
+                state.level -= 1
+                state.good = 0
+                state.samples.clear()
         else:
-            self._instant(incoming, outgoing)
+            state.good = 0
+
+    # — History ───────────────────────────────────────────────────────────
+
+    def go_back(self, transition: str | None = None, duration: int | None = None) -> bool:
+        """
+        Returns to the previous screen of the history, sliding in the
+        opposite direction of the navigation that left it. The live frame is
+        reused and its saved state handed to restore_state.
+
+        Returns:
+            False if there is no previous screen, or the busy policy dropped
+            the request.
+        """
+        return self._step_history(self._back_stack, "back", transition, duration)
+
+    def go_forward(self, transition: str | None = None, duration: int | None = None) -> bool:
+        """
+        Repeats the navigation undone by the last go_back(), in its original
+        direction.
+
+        Returns:
+            False if there is no next screen, or the busy policy dropped
+            the request.
+        """
+        return self._step_history(self._forward_stack, "forward", transition, duration)
+
+    @property
+    def can_go_back(self) -> bool:
+        return bool(self._back_stack)
+
+    @property
+    def can_go_forward(self) -> bool:
+        return bool(self._forward_stack)
+
+    @property
+    def navigation_history(self) -> list[str]:
+        """Screens of the back history, oldest first, followed by the current one."""
+        names = [name for name, _, _ in self._back_stack]
+        return names + [self.current] if self.current is not None else names
+
+    def _step_history(self, stack, kind, transition, duration) -> bool:
+        """Pops the newest entry of `stack` and navigates to it."""
+        # Removing screens can leave entries of the current screen on top
+        while stack and stack[-1][0] == self.current:
+            stack.pop()
+        if not stack:
+            return False
+        name, direction, state = stack[-1]
+        if self._animating:
+            return self._handle_busy(name, partial(self._step_history, stack, kind, transition, duration))
 
-    def on_navigate(self, callback):
-        """Registers a callback function to be called on every navigation event."""
-        self._on_navigate_callbacks.append(callback)
+        stack.pop()
+        self._history_step = (kind, state)
+        self.navigate(name, transition, _OPPOSITE.get(direction, direction) if kind == "back" else direction, duration)
+        self._history_step = None
+        return True
+
+    def _record_history(self, step: tuple[str, object] | None, direction: str):
+        """Pushes the screen being left onto the back or forward history."""
+        if self.current is None:
+            return
+
+        state = self._save_state(self.current)
+        if step is None:
+            self._back_stack.append((self.current, direction, state))
+            self._forward_stack.clear()
+        elif step[0] == "back":
+            # Stored in the direction go_forward() will slide again
+            self._forward_stack.append((self.current, _OPPOSITE.get(direction, direction), state))
+        else:
+            self._back_stack.append((self.current, direction, state))
+
+    def _save_state(self, name: str) -> object:
+        """Returns the save_state result of a built screen, or None."""
+        hooks = self.__hooks.get(name)
+        frame = self.__screens.get(name)
+        if not (hooks and hooks.save_state and frame is not None):
+            return None
+        try:
+            return hooks.save_state(frame)
+        except Exception as error:
+            self._report_error(error)
+            return None
+
+    def _forget_history(self, name: str):
+        """Drops the history entries of a removed screen."""
+        for stack in (self._back_stack, self._forward_stack):
+            entries = [entry for entry in stack if entry[0] != name]
+            stack.clear()
+            stack.extend(entries)
+
+    # — Session ───────────────────────────────────────────────────────────
+
+    def save_session(self):
+        """Writes the session to session_path right away, on the calling thread."""
+        if self.session_path is None:
+            return
+        if self._session_save_id is not None:
+            try:
+                self.root.after_cancel(self._session_save_id)
+            except tk.TclError:
+                pass
+            self._session_save_id = None
+        self._session_seq += 1
+        self._write_session(self._session_text(), self._session_seq)
+
+    def restore_session(self) -> bool:
+        """
+        Restores the session saved at session_path. Only the current screen
+        is built; the others keep their saved state until they are shown.
+
+        Returns:
+            False if there is no usable session.
+        """
+        try:
+            with open(self.session_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(data, dict) or data.get("version") != _SESSION_VERSION:
+            return False
+
+        current = data.get("current")
+        if not isinstance(current, str) or current.split(PATH_SEPARATOR, 1)[0] not in self.__factories:
+            return False
+
+        # Valid JSON of the wrong shape must not break startup. Entries of
+        # screens that no longer exist are skipped, malformed ones are not
+        states     = data.get("states", {})
+        history    = {key: data.get(key, []) for key in ("back", "forward")}
+        bar_scroll = data.get("bar_scroll", 0.0)
+        if not isinstance(states, dict) or not isinstance(bar_scroll, (int, float)):
+            return False
+        for stack in history.values():
+            if not isinstance(stack, list):
+                return False
+            for entry in stack:
+                if not (isinstance(entry, list) and len(entry) == 3
+                        and isinstance(entry[0], str) and isinstance(entry[1], str)):
+                    return False
+
+        def entries(key):
+            return [(entry[0], entry[1], entry[2]) for entry in history[key] if entry[0] in self.__factories]
+
+        self._session_states = {
+            name: state for name, state in states.items()
+            if name in self.__factories and state is not None
+        }
+        try:
+            self.navigate(current, transition=TRANSITION_NONE)
+        except KeyError:
+            # A nested level of the saved path no longer exists
+            self._session_states.clear()
+            return False
+
+        self._back_stack.clear()
+        self._back_stack.extend(entries("back"))
+        self._forward_stack.clear()
+        self._forward_stack.extend(entries("forward"))
+
+        # Scroll offsets and the drawer need the window and the nav chrome laid out
+        self._session_chrome = (bar_scroll, bool(data.get("drawer_open")))
+        self.root.after_idle(self._restore_chrome)
+        return True
+
+    def _restore_chrome(self):
+        """Idle callback: applies the restored bar scroll offset and drawer state."""
+        if self._session_chrome is None or self._nav_build_id is not None:
+            return  # Applied once the deferred nav build has run
+
+        bar_scroll, drawer_open = self._session_chrome
+        self._session_chrome = None
+        if bar_scroll:
+            self._set_bar_scroll(bar_scroll)
+        if drawer_open and self.nav_mode == NAV_DRAWER:
+            self.open_drawer()
+
+    def _schedule_session_save(self):
+        """Schedules a session write. Requests within session_delay are coalesced."""
+        if self.session_path is None or self._session_save_id is not None:
+            return
+        self._session_save_id = self.root.after(self.session_delay, self._flush_session)
+
+    def _flush_session(self):
+        """Serializes the session on the Tk thread and writes it on a worker."""
+        self._session_save_id = None
+        if self._animating:
+            # save_state hooks must not run between animation frames
+            self._schedule_session_save()
+            return
+        self._session_seq += 1
+        self._background.submit(
+            self._write_session, self._session_text(), self._session_seq, errback=self._report_error
+        )
+
+    def _session_text(self) -> str:
+        """Snapshot of the session as compact JSON. Unserializable states become null."""
+        states = dict(self._session_states)
+        for name in self.__screens:
+            state = self._save_state(name)
+            if state is not None:
+                states[name] = state
+
+        snapshot = {
+            "version":     _SESSION_VERSION,
+            "current":     self.current_path,
+            "back":        list(self._back_stack),
+            "forward":     list(self._forward_stack),
+            "drawer_open": self._drawer_open,
+            "bar_scroll":  self._bar_scroll_fraction(),
+            "states":      states,
+        }
+        return json.dumps(snapshot, separators=(",", ":"), default=lambda _: None)
+
+    def _write_session(self, text: str, seq: int):
+        """
+        Atomically replaces the session file. Runs on a worker thread as well
+        as the Tk thread; writes older than the last one written are skipped.
+        """
+        with self._session_lock:
+            if seq <= self._session_written:
+                return
+            directory = os.path.dirname(os.path.abspath(self.session_path))
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".session-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(text)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.session_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+            self._session_written = seq
+
+    def _bar_scroll_fraction(self) -> float:
+        """Scroll offset of the bottom bar as a fraction of its length."""
+        if isinstance(self._bar_scroll, _VirtualList):
+            total = len(self._bar_scroll.items) * self._bar_scroll.item_size
+            return self._bar_scroll.offset / total if total else 0.0
+        if self._bar_scroll is not None:
+            return self._bar_scroll._parent_canvas.xview()[0]
+        return 0.0
+
+    def _set_bar_scroll(self, fraction: float):
+        if isinstance(self._bar_scroll, _VirtualList):
+            self._bar_scroll.offset = int(fraction * len(self._bar_scroll.items) * self._bar_scroll.item_size)
+            self._bar_scroll.refresh()
+        elif self._bar_scroll is not None:
+            self._bar_scroll._parent_canvas.xview_moveto(fraction)
+
+    # — Nested Managers ───────────────────────────────────────────────────
+
+    def mount(self, name: str, child: "ScreensManager"):
+        """
+        Declares a manager placed inside screen `name` of this one, so that
+        paths like "name/child_screen" can be navigated. The child adopts
+        this manager's animation scheduler.
+        """
+        if name not in self.__factories:
+            raise KeyError(f"Screen '{name}' does not exist.")
+        if not child.scheduler.active:
+            child.scheduler = self.scheduler
+        self._children[name] = child
+
+    @property
+    def current_path(self) -> str | None:
+        """Path of the current screen through all mounted managers."""
+        if self.current is None:
+            return None
+        child = self._children.get(self.current)
+        child_path = child.current_path if child is not None else None
+        return f"{self.current}{PATH_SEPARATOR}{child_path}" if child_path else self.current
+
+    def _resolve_route(self, path: str) -> list[tuple["ScreensManager", str]]:
+        """
+        Returns the (manager, screen) pair of every level of a path. Each
+        level is a dict lookup; screens hosting a nested manager are built on
+        demand so that their factory can mount it.
+        """
+        segments = path.strip(PATH_SEPARATOR).split(PATH_SEPARATOR)
+        route    = []
+        manager  = self
+
+        for depth, segment in enumerate(segments):
+            if segment not in manager.__factories:
+                raise KeyError(f"Screen '{segment}' of path '{path}' does not exist.")
+            route.append((manager, segment))
+
+            if depth < len(segments) - 1:
+                child = manager._children.get(segment)
+                if child is None:
+                    manager._get_screen(segment)
+                    child = manager._children.get(segment)
+                if child is None:
+                    raise KeyError(f"Screen '{segment}' of path '{path}' has no mounted manager.")
+                manager = child
+        return route
+
+    def _navigate_path(self, path, transition, direction, duration, easing=None):
+        """
+        Navigates every level of a path. Only the outermost level that
+        changes is animated; the levels below it switch instantly beforehand,
+        so the incoming screen already shows the right nested screen.
+        """
+        route   = self._resolve_route(path)
+        changed = [depth for depth, (manager, segment) in enumerate(route) if manager.current != segment]
+        if not changed:
+            return
+
+        top = changed[0]
+        for manager, segment in reversed(route[top + 1:]):
+            if manager.current != segment:
+                manager.navigate(segment, transition=TRANSITION_NONE)
+
+        manager, segment = route[top]
+        manager.navigate(segment, transition, direction, duration, easing)
+
+    def _handle_busy(self, target: str, request: Callable[[], object]) -> bool:
+        """
+        Applies the busy policy to a navigation requested mid-transition.
+        `request` repeats the call once it may run, `target` is its destination.
+        Returns False if the policy dropped the request.
+        """
+        if self.busy_policy == BUSY_QUEUE:
+            self._pending.append((target, request))
+        elif self.busy_policy == BUSY_LATEST:
+            self._pending.clear()
+            self._pending.append((target, request))
+        elif self.busy_policy == BUSY_INTERRUPT and target != self.current:
+            # A running slide continues from where its incoming screen is now
+            if self._moving_in is not None:
+                info = self._moving_in.place_info()
+                self._retarget_from = (int(info.get("x", 0)), int(info.get("y", 0)))
+            self._transition_tween.cancel()
+            request()
+            self._retarget_from = None
+        else:
+            return False
+        return True
+
+    def _run_pending(self):
+        """Starts the next navigation requested during the last transition."""
+        while self._pending and not self._animating:
+            _, request = self._pending.popleft()
+            request()
+
+    def on_navigate(self, callback, mode: str = CALLBACK_SYNC, on_result: Callable | None = None):
+        """
+        Registers a callback function to be called with the screen name on
+        every navigation event.
+
+        Args:
+            callback: Function (or coroutine function) taking the screen name.
+            mode: CALLBACK_SYNC runs it before the transition starts,
+                CALLBACK_DEFERRED at idle once the transition has finished and
+                CALLBACK_THREADED on a worker thread. Coroutine functions
+                always run on a background asyncio loop.
+            on_result: Optional function called on the Tk thread with the
+                return value of a threaded or coroutine callback.
+        """
+        if inspect.iscoroutinefunction(callback):
+            mode = CALLBACK_THREADED
+        self._on_navigate_callbacks.append((callback, mode, on_result))
+
+    def _dispatch_callbacks(self, name: str):
+        """Runs or schedules the navigation callbacks. A failing callback never breaks navigation."""
+        for callback, mode, on_result in self._on_navigate_callbacks:
+            if mode == CALLBACK_DEFERRED:
+                self._deferred_calls.append((callback, name))
+            elif mode == CALLBACK_THREADED:
+                self._background.submit(callback, name, callback=on_result, errback=self._report_error)
+            else:
+                try:
+                    callback(name)
+                except Exception as error:
+                    self._report_error(error)
+
+    def _run_deferred_callbacks(self):
+        """Idle callback: runs the deferred callbacks of finished navigations."""
+        calls, self._deferred_calls = self._deferred_calls, []
+        for callback, name in calls:
+            try:
+                callback(name)
+            except Exception as error:
+                self._report_error(error)
+
+    def shutdown(self):
+        """
+        Stops the worker threads used by threaded and coroutine callbacks.
+        A session save that is still due is written first.
+        """
+        if self._session_save_id is not None:
+            self.save_session()
+        if self.lazy_appearance:
+            ctk.AppearanceModeTracker.remove(self._on_appearance_change)
+        self._background.shutdown()
+
+    # — Screen Lifecycle ──────────────────────────────────────────────────
+
+    def _enter_screen(self, name: str):
+        """Runs on_enter of a screen once the transition to it has finished."""
+        if self._entered == name:
+            return
+        self._entered = name
+
+        hooks = self.__hooks.get(name)
+        if hooks and hooks.on_enter:
+            self._call_hook(hooks.on_enter, self.__screens[name])
+
+    def _leave_screen(self, name: str | None):
+        """Cancels a screen's pending load and runs its on_leave."""
+        if name is None:
+            return
+        if self._entered == name:
+            self._entered = None
+
+        # Results of a load that already runs are discarded through the token
+        future = self._loads.pop(name, None)
+        if future is not None:
+            future.cancel()
+        self._load_tokens.pop(name, None)
+        self._hide_placeholder(name)
+
+        hooks = self.__hooks.get(name)
+        frame = self.__screens.get(name)
+        if hooks and hooks.on_leave and frame is not None:
+            self._call_hook(hooks.on_leave, frame)
+
+    def _start_loader(self, name: str, frame):
+        """Shows the placeholder of a screen and starts its loader in the background."""
+        hooks = self.__hooks.get(name)
+        if not hooks or not hooks.loader:
+            return
+
+        self._show_placeholder(name, frame, hooks)
+        token = self._load_tokens[name] = object()
+        self._loads[name] = self._background.submit(
+            hooks.loader,
+            name,
+            callback=partial(self._loader_done, name, token),
+            errback=partial(self._loader_failed, name, token),
+        )
+
+    def _loader_done(self, name: str, token: object, data):
+        """Tk thread: hands loaded data to the screen if it is still wanted."""
+        if self._load_tokens.get(name) is not token or name != self.current:
+            return
+        del self._load_tokens[name]
+        self._loads.pop(name, None)
+        self._hide_placeholder(name)
+
+        hooks = self.__hooks.get(name)
+        frame = self.__screens.get(name)
+        if hooks and hooks.on_loaded and frame is not None:
+            self._call_hook(hooks.on_loaded, frame, data)
+
+    def _loader_failed(self, name: str, token: object, error: BaseException):
+        """Tk thread: reports a failed load and removes its placeholder."""
+        if self._load_tokens.get(name) is token:
+            del self._load_tokens[name]
+            self._loads.pop(name, None)
+            self._hide_placeholder(name)
+        self._report_error(error)
+
+    def _show_placeholder(self, name: str, frame, hooks: ScreenHooks):
+        """Covers the screen with its placeholder widget."""
+        self._hide_placeholder(name)
+        if hooks.placeholder:
+            widget = hooks.placeholder(frame)
+        else:
+            widget = ctk.CTkLabel(frame, text="Loading…")
+        widget.place(x=0, y=0, relwidth=1, relheight=1)
+        widget.lift()
+        self._placeholders[name] = widget
+
+    def _hide_placeholder(self, name: str):
+        widget = self._placeholders.pop(name, None)
+        if widget is not None:
+            try: widget.destroy()
+            except: pass
+
+    def _call_hook(self, hook: Callable, *args):
+        """Runs a screen hook, reporting instead of raising its errors."""
+        try:
+            hook(*args)
+        except Exception as error:
+            self._report_error(error)
+
+    def _report_error(self, error: BaseException):
+        """Reports an exception through Tk's callback error handler."""
+        self.root._root().report_callback_exception(type(error), error, error.__traceback__)
+
+    # — Metrics ────────────────────────────────────────────────────────────
+
+    def metrics_stats(self) -> dict[str, dict[str, float]]:
+        """
+        Returns rolling statistics (count, mean, p50, p90, p99, max) of:
+        callbacks_ms, nav_active_ms, first_frame_ms, transition_ms,
+        frames_rendered, frames_planned, drawer_open_ms, drawer_close_ms
+        (time to the first drawer frame) and drawer_ms.
+        Empty unless the manager was created with metrics=True.
+        """
+        return self._metrics.stats() if self._metrics is not None else {}
+
+    def add_metrics_listener(self, callback: Callable[[dict], None]):
+        """Registers a callback receiving every navigation and drawer record."""
+        if self._metrics is None:
+            raise RuntimeError("Metrics are disabled. Create the manager with metrics=True.")
+        self._metrics.add_listener(callback)
+
+    def _record_first_frame(self, record: dict, key: str, started: float):
+        """Idle callback: the first frame of an animation has been drawn."""
+        record.setdefault(key, (time.perf_counter() - started) * 1000)
+
+    def _finish_nav_record(self):
+        """Completes the record of the navigation that just ended."""
+        record, self._nav_record = self._nav_record, None
+        report = self.last_transition if record["transition"] in TRANSITIONS else None
+
+        record["transition_ms"]   = report.elapsed if report else 0.0
+        record["frames_rendered"] = report.frames_rendered if report else 1
+        record["frames_planned"]  = report.planned_frames if report else 1
+        # Instant switches are drawn before their idle callback runs
+        record.setdefault("first_frame_ms", record["callbacks_ms"] + record["nav_active_ms"])
+        self._metrics.add(record)
+
+    def _settle_animations(self, finish: bool = False):
+        """
+        Stops the running animations before screens are torn down. The end
+        of the interrupted transition only does its bookkeeping: queued
+        navigations, on_enter, eviction and prewarming would act on screens
+        that are about to disappear. Callers resume with _after_transition().
+        """
+        self._settling = True
+        try:
+            if finish:
+                self.finish_animations()
+            else:
+                self.cancel_animations()
+        finally:
+            self._settling = False
+
+    def finish_animations(self):
+        """Jumps the running screen and drawer animations to their end."""
+        self.scheduler.finish(owner=self)
+
+    def cancel_animations(self):
+        """
+        Stops the running screen and drawer animations without rendering the
+        remaining frames. Screens and drawer are settled in their final layout.
+        """
+        self.scheduler.cancel(owner=self)
+
+    # ──────────────────────────────────────────────────────────────────────
+    #  Incremental Updates
+    # ──────────────────────────────────────────────────────────────────────
+
+    def add_nav_item(
+        self,
+        item: NavItem,
+        index: int | None = None,
+        factory: Callable[[ctk.CTkFrame], None] | None = None,
+        hooks: ScreenHooks | None = None,
+    ):
+        """
+        Inserts a nav item and creates only its button(s). Its screen is
+        registered (with the given factory and hooks) if it does not exist yet.
+
+        Args:
+            item: The new item.
+            index: Position in nav_items. Appends by default.
+            factory: Factory of the screen, if it has to be registered.
+            hooks: Lifecycle callbacks of the screen, if it has to be registered.
+        """
+        if self._nav_item(item.screen) is not None:
+            raise ValueError(f"A nav item for screen '{item.screen}' already exists.")
+        if item.screen not in self.__factories:
+            self.add_screen(item.screen, factory=factory, hooks=hooks)
+
+        index = len(self._nav_items) if index is None else index
+        self._nav_items.insert(index, item)
+        self._nav_index = None
+
+        # The button of the following item is the packing anchor
+        following = self._nav_items[index + 1].screen if index + 1 < len(self._nav_items) else None
+
+        if isinstance(self._bar_scroll, _VirtualList):
+            self._bar_scroll.set_items(self._nav_items)
+        elif self._bottom_bar is not None:
+            self._add_bar_button(item, before=self._bar_buttons.get(following))
+
+        if isinstance(self._drawer_scroll, _VirtualList):
+            self._drawer_scroll.set_items(self._nav_items)
+        elif self._drawer_scroll is not None:
+            self._add_drawer_button(item, before=self._drawer_buttons.get(following))
+
+    def remove_nav_item(self, screen: str, remove_screen: bool = False):
+        """
+        Removes a nav item and destroys only its button(s).
+
+        Args:
+            screen: Screen of the item to remove.
+            remove_screen: Also remove the screen itself (see remove_screen).
+        """
+        item = self._nav_item(screen)
+        if item is None:
+            raise KeyError(f"No nav item for screen '{screen}'.")
+
+        self._nav_items.remove(item)
+        self._nav_index = None
+        self._drop_nav_kwargs(screen)
+
+        for buttons, scroll in ((self._bar_buttons, self._bar_scroll), (self._drawer_buttons, self._drawer_scroll)):
+            if isinstance(scroll, _VirtualList):
+                scroll.set_items(self._nav_items)
+            else:
+                btn = buttons.pop(screen, None)
+                if btn is not None:
+                    btn.destroy()
+
+        if self._nav_active == screen:
+            self._nav_active = None
+        if remove_screen:
+            self.remove_screen(screen)
+
+    def update_nav_item(self, screen: str, **changes):
+        """
+        Changes attributes of a nav item (label, icon, style, active_style)
+        and reconfigures only its button(s).
+        """
+        item = self._nav_item(screen)
+        if item is None:
+            raise KeyError(f"No nav item for screen '{screen}'.")
+
+        for attribute, value in changes.items():
+            if attribute not in ("label", "icon", "style", "active_style"):
+                raise AttributeError(f"NavItem has no updatable attribute '{attribute}'.")
+            setattr(item, attribute, value)
+
+        self._drop_nav_kwargs(screen)
+        for kind, buttons in (("bar", self._bar_buttons), ("drawer", self._drawer_buttons)):
+            btn = buttons.get(screen)
+            if btn is not None:
+                base_kw, active_kw = self._nav_kwargs(kind, screen)
+                try: btn.configure(**(active_kw if screen == self._nav_active else base_kw))
+                except: pass
+
+    def reorder(self, screens: list[str]):
+        """
+        Reorders the nav items to follow the given screen order. Existing
+        buttons are re-packed, none is recreated.
+        """
+        if sorted(screens) != sorted(item.screen for item in self._nav_items):
+            raise ValueError("reorder() expects every nav item screen exactly once.")
+
+        items = {item.screen: item for item in self._nav_items}
+        self._nav_items[:] = [items[screen] for screen in screens]
+
+        # pack_info() reports scaled padding, CTk's pack() would scale it again
+        for buttons, scroll, pack_kw in (
+            (self._bar_buttons,    self._bar_scroll,    self._bar_pack_kw()),
+            (self._drawer_buttons, self._drawer_scroll, self._drawer_pack_kw()),
+        ):
+            if isinstance(scroll, _VirtualList):
+                scroll.set_items(self._nav_items)
+                continue
+
+            ordered = [buttons[screen] for screen in screens if screen in buttons]
+            if not ordered:
+                continue
+            for btn in ordered:
+                btn.pack_forget()
+            for btn in ordered:
+                btn.pack(**pack_kw)
+
+    def remove_screen(self, name: str):
+        """
+        Removes a single screen, its frame and its nav item. Other screens
+        and their state are left untouched.
+        """
+        if name not in self.__factories:
+            raise KeyError(f"Screen '{name}' does not exist.")
+        if name == self.current:
+            raise ValueError(f"Cannot remove the current screen '{name}'.")
+
+        # Dropped first, so finishing the transition cannot navigate back to it
+        self._pending = deque(entry for entry in self._pending if entry[0] != name)
+
+        # The screen may still be sliding or fading out
+        settled = self._animating and name == self._leaving
+        if settled:
+            self._settle_animations(finish=True)
+            if name == self.current:
+                self._after_transition()
+                raise ValueError(f"Cannot remove the current screen '{name}'.")
+
+        if self._nav_item(name) is not None:
+            self.remove_nav_item(name)
+
+        future = self._loads.pop(name, None)
+        if future is not None:
+            future.cancel()
+        self._load_tokens.pop(name, None)
+        self._placeholders.pop(name, None)
+
+        del self.__factories[name]
+        self.__hooks.pop(name, None)
+        if name not in self._unattached:
+            self.__dict__.pop(name, None)
+        self._unattached.discard(name)
+        self._recency.pop(name, None)
+        self._widget_counts.pop(name, None)
+        self._evicted_state.pop(name, None)
+        self._building.pop(name, None)
+        self._prewarmed.discard(name)
+        self._children.pop(name, None)
+        self._transitions.pop(name, None)
+        self._quality.pop(name, None)
+        self._quality_override.pop(name, None)
+        for targets in self._transitions.values():
+            targets.pop(name, None)
+        self._forget_history(name)
+        self._session_states.pop(name, None)
+        self._detached.pop(name, None)
+
+        frame = self.__screens.pop(name, None)
+        if frame is not None:
+            frame.destroy()
+        if settled:
+            self._after_transition()
+
+    def _drop_nav_kwargs(self, screen: str):
+        """Forgets the cached button kwargs of one screen."""
+        self._nav_kw.pop(("bar", screen), None)
+        self._nav_kw.pop(("drawer", screen), None)
 
     # ──────────────────────────────────────────────────────────────────────
     #  Navigation UI Builders
@@ -328,6 +2671,8 @@ class ScreensManager:
 
     def _build_nav(self):
         """Dispatches navigation construction based on nav_mode."""
+        self._invalidate_nav_cache()
+        self._nav_active = None
         if self.nav_mode == NAV_BOTTOM:
             self._build_bottom_bar()
         elif self.nav_mode == NAV_DRAWER:
@@ -349,6 +2694,23 @@ class ScreensManager:
         self._bottom_bar.grid(row=1, column=0, sticky="ew")
         self.root.grid_rowconfigure(1, weight=0)
 
+        self._bar_buttons.clear()
+        if s.virtualize:
+            self._bar_scroll = _VirtualList(
+                self._bottom_bar,
+                self.nav_items,
+                orientation="horizontal",
+                item_size=s.button_width + 2 * s.padx,
+                create=self._create_bar_button,
+                bind=partial(self._bind_nav_button, "bar", self._bar_buttons),
+                unbind=lambda item: self._bar_buttons.pop(item.screen, None),
+                place=lambda btn, pos: btn.place(x=pos + s.padx, y=s.pady),
+                scrollbar_kw={"fg_color": s.fg_color} if s.fg_color else None,
+                height=s.button_height + 2 * s.pady,
+            )
+            self._bar_scroll.pack(fill="both", expand=True)
+            return
+
         # Horizontal scrollable container for navigation buttons
         scroll_kw: dict = {
             "orientation": "horizontal",
@@ -366,25 +2728,57 @@ class ScreensManager:
         self._bar_scroll.bind("<Button-4>",      self._bar_on_mousewheel)
         self._bar_scroll.bind("<Button-5>",      self._bar_on_mousewheel)
 
-        self._bar_buttons.clear()
-
         for item in self.nav_items:
-            text = self._resolve_button_text(item, s.layout, s.icon_font, s.label_font)
+            self._add_bar_button(item)
+
+    def _add_bar_button(self, item: NavItem, before=None):
+        """Creates the button of an item in a regular bottom bar."""
+        s    = self.bottom_bar_style
+        text = self._resolve_button_text(item, s.layout, s.icon_font, s.label_font)
+
+        btn_kw: dict = {
+            "width":  s.button_width,
+            "height": s.button_height,
+            "text":   text,
+            **item.style,
+        }
 
-            btn_kw: dict = {
-                "width":  s.button_width,
-                "height": s.button_height,
-                "text":   text,
-                **item.style,
-            }
+        btn = ctk.CTkButton(
+            self._bar_scroll,
+            command=partial(self.navigate, item.screen),
+            **btn_kw,
+        )
+        btn.pack(**self._bar_pack_kw(), **({"before": before} if before else {}))
+        self._bar_buttons[item.screen] = btn
 
-            btn = ctk.CTkButton(
-                self._bar_scroll,
-                command=lambda n=item.screen: self.navigate(n),
-                **btn_kw,
-            )
-            btn.pack(side="left", padx=s.padx, pady=s.pady)
-            self._bar_buttons[item.screen] = btn
+    def _bar_pack_kw(self) -> dict:
+        """Unscaled pack options of the regular bottom bar buttons."""
+        s = self.bottom_bar_style
+        return {"side": "left", "padx": s.padx, "pady": s.pady}
+
+    def _create_bar_button(self, parent) -> ctk.CTkButton:
+        """Creates an unbound bottom bar button for a virtualized bar."""
+        s = self.bottom_bar_style
+        return ctk.CTkButton(parent, width=s.button_width, height=s.button_height)
+
+    def _bind_nav_button(self, kind: str, buttons: dict, btn, item: NavItem):
+        """Shows a nav item on a recycled button of a virtualized bar or drawer."""
+        kwargs = self._nav_kwargs(kind, item.screen)
+        if kwargs is None:
+            return
+        base_kw, active_kw = kwargs
+        command = self.navigate if kind == "bar" else self._drawer_navigate
+        applied = active_kw if item.screen == self._nav_active else base_kw
+
+        # Keys set by an item shown before are reset to the button's own values
+        originals = self._recycled_kw.setdefault(btn, {})
+        for key in active_kw:
+            if key not in originals:
+                originals[key] = btn.cget(key)
+        restore = {key: value for key, value in originals.items() if key not in applied}
+
+        btn.configure(command=partial(command, item.screen), **restore, **applied)
+        buttons[item.screen] = btn
 
     def _bar_on_mousewheel(self, event):
         """Redirects vertical scroll events to horizontal scroll for the bottom bar."""
@@ -416,6 +2810,10 @@ class ScreensManager:
         """Initializes components required for the Navigation Drawer."""
         s = self.drawer_style
 
+        self._destroy_drawer()
+        if s.persistent:
+            self.root.after_idle(self._create_drawer)
+
         self._hamburger_btn = None
         if s.show_hamburger:
             ham_kw: dict = {
@@ -439,22 +2837,56 @@ class ScreensManager:
             )
             self._hamburger_btn.lift()
 
-        if s.enable_swipe:
-            self.root.bind("<ButtonPress-1>",   self._on_swipe_start)
-            self.root.bind("<ButtonRelease-1>",  self._on_swipe_end)
+        # Added to the app's own bindings, once; the handlers check enable_swipe
+        if s.enable_swipe and not self._swipe_bound:
+            self.root.bind("<ButtonPress-1>",   self._on_swipe_start, add="+")
+            self.root.bind("<B1-Motion>",       self._on_swipe_move,  add="+")
+            self.root.bind("<ButtonRelease-1>", self._on_swipe_end,   add="+")
+            self._swipe_bound = True
 
     def open_drawer(self):
         """Animates the drawer opening."""
         if self._drawer_open or self._animating:
             return
         
+        started = time.perf_counter() if self._metrics is not None else None
+        self._show_drawer()
+
+        # Animation Trigger
+        start_x, end_x = self._drawer_positions()
+        self._animate_drawer(start_x, end_x, started=started)
+
+    def _show_drawer(self):
+        """Shows the overlay and the drawer, still in its closed position."""
         self._drawer_open = True
+
+        # Persistent drawers are only built once and re-shown afterwards
+        if self._drawer_overlay is None:
+            self._create_drawer()
+        self._drawer_overlay.place(x=0, y=0, relwidth=1, relheight=1)
+        self._drawer_frame.place_configure(x=self._drawer_positions()[0])
+
+        self._drawer_overlay.lift()
+        self._drawer_frame.lift()
+
+    def _drawer_positions(self) -> tuple[int, int]:
+        """Returns the drawer's x when closed and when open."""
+        s = self.drawer_style
+        w = self.root.winfo_width()
+        if s.side == "left":
+            return -s.width, 0
+        return w, w - s.width
+
+    def _create_drawer(self):
+        """Creates the overlay, drawer frame and item buttons, hidden unless the drawer is open."""
+        if self._drawer_overlay is not None:
+            return
+
         s = self.drawer_style
         w = self.root.winfo_width()
 
         # Create semi-transparent overlay
         self._drawer_overlay = ctk.CTkFrame(self.root, fg_color=s.overlay_color, corner_radius=0)
-        self._drawer_overlay.place(x=0, y=0, relwidth=1, relheight=1)
         self._drawer_overlay.bind("<Button-1>", lambda _: self.close_drawer())
 
         # Main drawer container
@@ -466,9 +2898,6 @@ class ScreensManager:
 
         self._drawer_frame = ctk.CTkFrame(self._drawer_overlay, **drawer_kw)
         self._drawer_frame.place(relheight=1, x=-s.width if s.side == "left" else w, y=0)
-        
-        self._drawer_overlay.lift()
-        self._drawer_frame.lift()
 
         # Optional Header
         if s.header:
@@ -476,6 +2905,22 @@ class ScreensManager:
             ctk.CTkLabel(self._drawer_frame, **hdr_kw).pack(fill="x", padx=s.item_padx, pady=(16, 8))
             ctk.CTkFrame(self._drawer_frame, height=1, fg_color="gray50").pack(fill="x", padx=s.item_padx, pady=(0, 8))
 
+        self._drawer_buttons.clear()
+        if s.virtualize:
+            self._drawer_scroll = _VirtualList(
+                self._drawer_frame,
+                self.nav_items,
+                orientation="vertical",
+                item_size=s.button_height + 4,
+                create=lambda parent: ctk.CTkButton(parent, height=s.button_height, anchor="w"),
+                bind=partial(self._bind_nav_button, "drawer", self._drawer_buttons),
+                unbind=lambda item: self._drawer_buttons.pop(item.screen, None),
+                place=self._place_drawer_button,
+                scrollbar_kw={"fg_color": s.fg_color} if s.fg_color else None,
+            )
+            self._drawer_scroll.pack(fill="both", expand=True, pady=(0, 8))
+            return
+
         # Scrollable area for menu items
         scroll_kw: dict = {"fg_color": "transparent"}
         if s.fg_color:
@@ -485,66 +2930,114 @@ class ScreensManager:
         self._drawer_scroll.pack(fill="both", expand=True, pady=(0, 8))
 
         # Populating items
-        self._drawer_buttons.clear()
         for item in self.nav_items:
-            text = self._resolve_drawer_text(item, s.layout)
-            btn_kw: dict = {"text": text, "height": s.button_height, "anchor": "w", **item.style}
-            
-            if item.screen == self.current and item.active_style:
-                btn_kw.update(item.active_style)
-
-            btn = ctk.CTkButton(
-                self._drawer_scroll,
-                command=lambda n=item.screen: (self.close_drawer(), self.navigate(n)),
-                **btn_kw,
-            )
-            btn.pack(fill="x", padx=s.item_padx, pady=2)
-            self._drawer_buttons[item.screen] = btn
-
-        # Animation Trigger
-        start_x = -s.width if s.side == "left" else w
-        end_x   = 0        if s.side == "left" else w - s.width
-        steps   = max(10, s.duration // 16)
-        step_ms = s.duration // steps
-        self._animate_drawer(start_x, end_x, steps, step_ms, 0)
+            self._add_drawer_button(item)
+
+    def _place_drawer_button(self, btn, position: int):
+        """Places a button of a virtualized drawer, fitted to the viewport width."""
+        s        = self.drawer_style
+        viewport = self._drawer_scroll.viewport
+
+        # CTk widgets take their size in unscaled units and only through configure()
+        width = viewport.winfo_width() / ctk.ScalingTracker.get_widget_scaling(viewport)
+        width = max(1, int(width) - 2 * s.item_padx)
+        if btn.cget("width") != width:
+            btn.configure(width=width)
+        btn.place(x=s.item_padx, y=position + 2)
+
+    def _add_drawer_button(self, item: NavItem, before=None):
+        """Creates the button of an item in a regular drawer."""
+        s    = self.drawer_style
+        text = self._resolve_drawer_text(item, s.layout)
+        btn_kw: dict = {"text": text, "height": s.button_height, "anchor": "w", **item.style}
+        
+        if item.screen == self.current and item.active_style:
+            btn_kw.update(item.active_style)
+
+        btn = ctk.CTkButton(
+            self._drawer_scroll,
+            command=partial(self._drawer_navigate, item.screen),
+            **btn_kw,
+        )
+        btn.pack(**self._drawer_pack_kw(), **({"before": before} if before else {}))
+        self._drawer_buttons[item.screen] = btn
+
+    def _drawer_pack_kw(self) -> dict:
+        """Unscaled pack options of the regular drawer buttons."""
+        return {"fill": "x", "padx": self.drawer_style.item_padx, "pady": 2}
+
+    def _drawer_navigate(self, name: str):
+        """Command of the drawer items."""
+        self.close_drawer()
+        self.navigate(name)
+
+    def _destroy_drawer(self):
+        """Destroys the drawer widgets, if any."""
+        self._drawer_open = False
+        self._drawer_buttons.clear()
+        if self._drawer_frame:
+            self._drawer_frame.destroy()
+            self._drawer_frame = None
+        if self._drawer_overlay:
+            self._drawer_overlay.destroy()
+            self._drawer_overlay = None
+        self._drawer_scroll = None
 
     def close_drawer(self):
         """Animates the drawer closing."""
         if not self._drawer_open or self._animating:
             return
         
-        s = self.drawer_style
-        w = self.root.winfo_width()
-
-        start_x = 0        if s.side == "left" else w - s.width
-        end_x   = -s.width if s.side == "left" else w
-        steps   = max(10, s.duration // 16)
-        step_ms = s.duration // steps
-        self._animate_drawer(start_x, end_x, steps, step_ms, 0, closing=True)
-
-    def _animate_drawer(self, start_x, end_x, steps, step_ms, step, closing=False):
-        """Recursive step function for drawer animation."""
-        progress = (step + 1) / steps
-        ease     = self._ease_out(progress)
-        x        = int(start_x + (end_x - start_x) * ease)
+        started = time.perf_counter() if self._metrics is not None else None
+        end_x, start_x = self._drawer_positions()
+        self._animate_drawer(start_x, end_x, closing=True, started=started)
+
+    def _animate_drawer(self, start_x, end_x, closing=False, started=None, duration=None):
+        """Starts the drawer tween on the shared scheduler."""
+        if started is not None:
+            event = "drawer_close" if closing else "drawer_open"
+            self._drawer_record = {"event": event}
+            self.root.after_idle(partial(self._record_first_frame, self._drawer_record, f"{event}_ms", started))
+
+        done = partial(self._drawer_done, closing)
+        self._drawer_tween = self.scheduler.start(
+            "drawer",
+            duration if duration is not None else self.drawer_style.duration,
+            partial(self._drawer_step, start_x, end_x, self.root.winfo_width()),
+            on_done=done,
+            on_cancel=done,
+            owner=self,
+        )
+
+    def _drawer_step(self, start_x, end_x, width, progress):
+        """
+        Places the drawer for the given animation progress. A right-side
+        drawer follows the window when it was resized since the start.
+        """
+        ease = EASINGS[EASE_OUT](progress)
+        x    = int(start_x + (end_x - start_x) * ease)
+        if self.drawer_style.side != "left":
+            x += self.root.winfo_width() - width
 
         if self._drawer_frame:
             self._drawer_frame.place_configure(x=x)
 
-        if step + 1 < steps:
-            self.root.after(
-                step_ms,
-                lambda: self._animate_drawer(start_x, end_x, steps, step_ms, step + 1, closing)
-            )
+    def _drawer_done(self, closing, tween):
+        """Finalizes a drawer animation."""
+        self.last_drawer_transition = tween.report
+        if self._drawer_record is not None:
+            record, self._drawer_record = self._drawer_record, None
+            record["drawer_ms"] = tween.report.elapsed
+            self._metrics.add(record)
+        self._schedule_session_save()
+        if not closing:
+            return
+
+        if self.drawer_style.persistent and self._drawer_overlay:
+            self._drawer_open = False
+            self._drawer_overlay.place_forget()
         else:
-            if closing:
-                self._drawer_open = False
-                if self._drawer_frame:
-                    self._drawer_frame.destroy()
-                    self._drawer_frame = None
-                if self._drawer_overlay:
-                    self._drawer_overlay.destroy()
-                    self._drawer_overlay = None
+            self._destroy_drawer()
 
     @staticmethod
     def _resolve_drawer_text(item: NavItem, layout: str) -> str:
@@ -563,62 +3056,296 @@ class ScreensManager:
     # — Swipe Handling ────────────────────────────────────────────────────
 
     def _on_swipe_start(self, event):
-        """Records the initial X position of a touch/click."""
-        self._swipe_start_x = event.x_root
+        """Starts tracking a press that may turn into a drawer drag."""
+        s = self.drawer_style
+        self._swipe_tracking = False
+        self._swipe_from     = None
+        if self.nav_mode != NAV_DRAWER or not s.enable_swipe or self._animating:
+            return
+        if self._drawer_tween is not None and not self._drawer_tween.done:
+            return
+
+        # Closed drawers can only be pulled out from the window edge
+        if not self._drawer_open:
+            x = event.x_root - self.root.winfo_rootx()
+            w = self.root.winfo_width()
+            if (x > s.edge_width) if s.side == "left" else (x < w - s.edge_width):
+                return
+
+        self._swipe_tracking = True
+        self._swipe_start_x  = event.x_root
+        self._swipe_samples.clear()
+        self._swipe_samples.append((time.perf_counter(), event.x_root))
+
+    def _on_swipe_move(self, event):
+        """Records the pointer; the drawer is moved at most once per frame."""
+        if not self._swipe_tracking:
+            return
+        self._swipe_samples.append((time.perf_counter(), event.x_root))
+        self._swipe_x = event.x_root
+
+        if self._swipe_from is None:
+            s     = self.drawer_style
+            delta = event.x_root - self._swipe_start_x
+            if s.side != "left":
+                delta = -delta
+
+            # Past the threshold towards the other state, the drawer follows
+            if self._drawer_open and delta > -s.swipe_threshold:
+                return
+            if not self._drawer_open and delta < s.swipe_threshold:
+                return
+            closed_x, open_x = self._drawer_positions()
+            was_open = self._drawer_open
+            if not was_open:
+                self._show_drawer()
+            self._swipe_from    = open_x if was_open else closed_x
+            self._swipe_start_x = event.x_root
+
+        if self._swipe_frame_id is None:
+            self._swipe_frame_id = self.root.after(FRAME_MS, self._swipe_render)
+
+    def _swipe_render(self):
+        """Places the drawer at the latest pointer position."""
+        self._swipe_frame_id = None
+        if self._swipe_from is not None and self._drawer_frame:
+            self._drawer_frame.place_configure(x=self._swipe_drawer_x())
+
+    def _swipe_drawer_x(self) -> int:
+        """Drawer x for the latest pointer position, clamped to its range."""
+        closed_x, open_x = self._drawer_positions()
+        x = self._swipe_from + self._swipe_x - self._swipe_start_x
+        return max(min(closed_x, open_x), min(max(closed_x, open_x), x))
 
     def _on_swipe_end(self, event):
-        """Calculates distance and triggers drawer if threshold is met."""
+        """Settles a drag open or closed, by release velocity or position."""
+        self._swipe_tracking = False
+        if self._swipe_from is None:
+            return
+        if self._swipe_frame_id is not None:
+            self.root.after_cancel(self._swipe_frame_id)
+            self._swipe_frame_id = None
+
+        self._swipe_samples.append((time.perf_counter(), event.x_root))
+        self._swipe_x    = event.x_root
+        x                = self._swipe_drawer_x()
+        self._swipe_from = None
+        s = self.drawer_style
+        closed_x, open_x = self._drawer_positions()
+
+        # Velocity over the last 100 ms, positive towards the open position
+        now     = self._swipe_samples[-1][0]
+        recent  = [sample for sample in self._swipe_samples if now - sample[0] <= 0.1]
+        elapsed = (recent[-1][0] - recent[0][0]) * 1000
+        velocity = (recent[-1][1] - recent[0][1]) / elapsed if elapsed > 0 else 0.0
+        if s.side != "left":
+            velocity = -velocity
+
+        if abs(velocity) >= s.fling_velocity:
+            settle_open = velocity > 0
+        else:
+            settle_open = abs(x - open_x) < s.width / 2
+
+        # The remaining distance takes its share of the full duration
+        end_x    = open_x if settle_open else closed_x
+        duration = max(FRAME_MS, int(s.duration * abs(end_x - x) / s.width))
+        self._animate_drawer(x, end_x, closing=not settle_open, duration=duration)
+
+    # — Resize Handling ───────────────────────────────────────────────────
+
+    def _on_content_configure(self, event):
+        """Records the new content size; it is applied at most once per frame."""
+        size = (event.width, event.height)
+        if size == self._content_size and self._resize_frame_id is None:
+            return
+        self._resize_size    = size
+        self._resize_last    = time.perf_counter()
+        self._resize_events += 1
+
+        # The first size is the initial layout, not a resize
+        if self._content_size is None:
+            self._content_size  = size
+            self._resize_events = 0
+            return
+        if self._resize_frame_id is None:
+            self._resize_frame_id = self.root.after(FRAME_MS, self._apply_resize)
+
+    def _apply_resize(self):
+        """Frame callback of a resize: retargets animations, freezes and thaws."""
+        self._resize_frame_id = None
+        self._content_size    = self._resize_size
+
+        if time.perf_counter() - self._resize_last < self.resize_settle_ms / 1000:
+            # A single event may be a one-off relayout; a second one is a drag
+            if self.freeze_on_resize and self._resize_events > 1:
+                self._freeze()
+            self._resize_frame_id = self.root.after(FRAME_MS, self._apply_resize)
+            return
+
+        self._resize_events = 0
+        self._thaw()
+
+        # An open drawer on the right moves with the window edge
+        if self._drawer_open and self._drawer_frame and (self._drawer_tween is None or self._drawer_tween.done):
+            if self._swipe_from is None:
+                self._drawer_frame.place_configure(x=self._drawer_positions()[1])
+
+    def _freeze(self):
+        """Replaces the current screen by a childless frame of its color."""
+        if self._frozen is not None or self._animating or self.current is None:
+            return
+        frame = self.__screens.get(self.current)
+        if frame is None:
+            return
+
+        if self._freeze_proxy is None:
+            self._freeze_proxy = tk.Frame(self._content_frame, bd=0, highlightthickness=0)
+        self._freeze_proxy.configure(bg=self._frame_color(frame))
+        self._freeze_proxy.place(x=0, y=0, relwidth=1, relheight=1)
+        self._freeze_proxy.lift()
+        frame.grid_remove()
+        self._frozen = self.current
+
+    def _thaw(self):
+        """Shows the frozen screen again, laid out once for the final size."""
+        if self._frozen is None:
+            return
+        frame, self._frozen = self.__screens.get(self._frozen), None
+        if frame is not None:
+            frame.grid()
+        self._freeze_proxy.place_forget()
+
+    # — Appearance Mode ───────────────────────────────────────────────────
+
+    @staticmethod
+    def _appearance_mode() -> str:
+        """Current appearance mode, as passed to appearance callbacks."""
+        return "Dark" if ctk.AppearanceModeTracker.get_mode() == 1 else "Light"
+
+    def _schedule_detach(self):
+        if self.lazy_appearance and self._detach_id is None:
+            self._detach_id = self.root.after_idle(self._detach_hidden)
+
+    def _detach_hidden(self):
+        """
+        Idle callback: takes the appearance callbacks of all hidden screens
+        out of the tracker, with a single pass over its callback list.
+        Only callbacks still in the list are taken, so screens of nested
+        managers are not detached twice.
+        """
+        self._detach_id = None
         if self._animating:
+            return  # Rescheduled once the transition ends
+
+        hidden = [
+            name for name in self.__screens
+            if name != self.current and name not in self._detached and name not in self._building
+        ]
+        if not hidden:
             return
-        
-        s     = self.drawer_style
-        delta = event.x_root - self._swipe_start_x
-        w     = self.root.winfo_width()
 
-        if s.side == "left":
-            if not self._drawer_open and delta > s.swipe_threshold and self._swipe_start_x < 40:
-                self.open_drawer()
-            elif self._drawer_open and delta < -s.swipe_threshold:
-                self.close_drawer()
-        else:
-            if not self._drawer_open and delta < -s.swipe_threshold and self._swipe_start_x > w - 40:
-                self.open_drawer()
-            elif self._drawer_open and delta > s.swipe_threshold:
-                self.close_drawer()
+        owners = {}
+        for name in hidden:
+            stack = [self.__screens[name]]
+            while stack:
+                widget = stack.pop()
+                callback = getattr(widget, "_set_appearance_mode", None)
+                if callback is not None:
+                    owners[callback] = name
+                stack.extend(widget.winfo_children())
+
+        tracker = ctk.AppearanceModeTracker
+        keep, taken = [], {name: [] for name in hidden}
+        for callback in tracker.callback_list:
+            name = owners.get(callback)
+            if name is None:
+                keep.append(callback)
+            else:
+                taken[name].append(callback)
+        tracker.callback_list[:] = keep
+
+        mode = self._appearance_mode()
+        for name, callbacks in taken.items():
+            self._detached[name] = _DetachedScreen(callbacks, mode)
+
+    def _attach_appearance(self, name: str):
+        """Hands a hidden screen back to the tracker, recoloring it if the mode changed."""
+        entry = self._detached.pop(name, None)
+        if entry is None:
+            return
+
+        mode = self._appearance_mode()
+        if entry.mode != mode:
+            for callback in entry.callbacks[entry.position:]:
+                try:
+                    callback(mode)
+                except Exception:
+                    continue
+
+        # Widgets destroyed while detached are dropped
+        ctk.AppearanceModeTracker.callback_list.extend(
+            callback for callback in entry.callbacks if callback.__self__.winfo_exists()
+        )
+
+    def _on_appearance_change(self, mode_string: str):
+        """Tracker callback: hidden screens are recolored in idle slices."""
+        self._ramp_cache.clear()
+        for entry in self._detached.values():
+            entry.position = 0
+        if self._detached and self._recolor_id is None:
+            self._recolor_id = self.root.after_idle(self._recolor_step)
+
+    def _recolor_step(self):
+        """Idle slice: recolors hidden screens until the time budget is spent."""
+        self._recolor_id = None
+        if self.scheduler.active:
+            self._recolor_id = self.root.after(FRAME_MS, self._recolor_step)
+            return
+
+        mode     = self._appearance_mode()
+        deadline = time.perf_counter() + self.prewarm_budget_ms / 1000
+        for entry in self._detached.values():
+            if entry.mode == mode:
+                continue
+            while entry.position < len(entry.callbacks):
+                if time.perf_counter() >= deadline:
+                    self._recolor_id = self.root.after_idle(self._recolor_step)
+                    return
+                callback = entry.callbacks[entry.position]
+                entry.position += 1
+                entry.mode = None  # Mixed until the pass completes
+                try:
+                    callback(mode)
+                except Exception:
+                    continue
+            entry.mode, entry.position = mode, 0
 
     # — Active State Management ───────────────────────────────────────────
 
     def _update_nav_active(self, name: str):
-        """Refreshes the appearance of nav buttons to highlight the active screen."""
-        # Update Bottom Bar buttons
-        for screen, btn in self._bar_buttons.items():
-            item = next((i for i in self.nav_items if i.screen == screen), None)
-            if not item: continue
-            
-            s = self.bottom_bar_style
-            text = self._resolve_button_text(item, s.layout, s.icon_font, s.label_font)
-            base_kw = {"text": text, **item.style}
-            
-            if screen == name and item.active_style:
-                base_kw.update(item.active_style)
-            
-            try: btn.configure(**base_kw)
-            except: pass
+        """
+        Highlights the active screen. Only the buttons of the previously and
+        newly active screens are reconfigured.
+        """
+        previous = self._nav_active
+        self._nav_active = name
 
-        # Update Drawer buttons (if drawer exists)
-        for screen, btn in self._drawer_buttons.items():
-            item = next((i for i in self.nav_items if i.screen == screen), None)
-            if not item: continue
-            
-            s    = self.drawer_style
-            text = self._resolve_drawer_text(item, s.layout)
-            base_kw = {"text": text, **item.style}
-            
-            if screen == name and item.active_style:
-                base_kw.update(item.active_style)
-            
-            try: btn.configure(**base_kw)
-            except: pass
+        for kind, buttons in (("bar", self._bar_buttons), ("drawer", self._drawer_buttons)):
+            for screen in (previous, name):
+                btn = buttons.get(screen)
+                if btn is None or (screen == previous == name):
+                    continue
+
+                kwargs = self._nav_kwargs(kind, screen)
+                if kwargs is None:
+                    continue
+
+                base_kw, active_kw = kwargs
+                if base_kw is active_kw:
+                    continue
+
+                try: btn.configure(**(active_kw if screen == name else base_kw))
+                except: pass
 
     # ──────────────────────────────────────────────────────────────────────
     #  Animation Engines
@@ -630,124 +3357,266 @@ class ScreensManager:
             outgoing.grid_forget()
         incoming.grid(row=0, column=0, sticky=ctk.NSEW)
         self._content_frame.update_idletasks()
+        self._end_transition()
+
+    def _end_transition(self):
+        """Common bookkeeping once a screen transition has completed."""
+        self._animating = False
+        if self._quality_sample is not None:
+            self._update_quality()
+        if self._settling:
+            self._nav_record = None
+            return
+        self._after_transition()
+
+    def _after_transition(self):
+        """Runs hooks and queued work once the screens have settled."""
+        if self.current is not None:
+            self._enter_screen(self.current)
+        if self._nav_record is not None:
+            self._finish_nav_record()
+        if self._deferred_calls:
+            self.root.after_idle(self._run_deferred_callbacks)
+        self._enforce_budget()
+        self._run_pending()
+        self._schedule_prewarm()
+        self._schedule_session_save()
+        self._schedule_detach()
 
     # — Fade Transition ────────────────────────────────────────────────────
 
-    def _fade(self, incoming, outgoing, duration):
+    def _fade(self, transition, name, incoming, outgoing, duration, steps=None, easing=None):
         """Initiates a cross-fade transition."""
         self._animating = True
-        steps   = max(10, duration // 16)
-        step_ms = duration // steps
+        steps = steps or max(10, duration // FRAME_MS)
 
-        self._reset_frame_color(incoming, 0.0)
+        # Colors are restored once the fade ends, so custom backgrounds survive
+        color_in = incoming.cget("fg_color")
+        ramp_in  = self._color_ramp(incoming, steps)
+        self._set_ramp_color(incoming, ramp_in, 0.0)
 
+        # Fading out and fading in each take the full duration
+        color_out, ramp_out = None, None
         if outgoing:
-            self._reset_frame_color(outgoing, 1.0)
-            self._fade_out(outgoing, incoming, steps, step_ms, 1.0)
+            color_out = outgoing.cget("fg_color")
+            ramp_out  = self._color_ramp(outgoing, steps)
+            self._set_ramp_color(outgoing, ramp_out, 1.0)
+            duration *= 2
         else:
             incoming.grid(row=0, column=0, sticky=ctk.NSEW)
-            self._fade_in(incoming, steps, step_ms, 0.0)
 
-    def _fade_out(self, outgoing, incoming, steps, step_ms, alpha):
-        """Recursive step for fading out a frame."""
-        alpha = round(alpha - 1 / steps, 3)
-        try: outgoing.configure(fg_color=self._alpha_color(alpha))
-        except: pass
+        frames = max(1, duration // FRAME_MS)
+        table  = self._keyframes(transition, easing, frames, 0, 0, None)
 
-        if alpha > 0:
-            self.root.after(step_ms, lambda: self._fade_out(outgoing, incoming, steps, step_ms, alpha))
-        else:
-            outgoing.grid_forget()
-            try: outgoing.configure(fg_color=self._get_base_color())
-            except: pass
-            incoming.grid(row=0, column=0, sticky=ctk.NSEW)
-            self._fade_in(incoming, steps, step_ms, 0.0)
+        done = partial(self._fade_done, incoming, outgoing, color_in, color_out)
+        self._transition_tween = self.scheduler.start(
+            name,
+            duration,
+            partial(self._fade_step, incoming, outgoing, ramp_in, ramp_out, color_out, table),
+            on_done=done,
+            on_cancel=done,
+            owner=self,
+        )
 
-    def _fade_in(self, incoming, steps, step_ms, alpha):
-        """Recursive step for fading in a frame."""
-        alpha = round(alpha + 1 / steps, 3)
-        try: incoming.configure(fg_color=self._alpha_color(alpha))
-        except: pass
+    def _fade_step(self, incoming, outgoing, ramp_in, ramp_out, color_out, table, progress):
+        """
+        Colors the frames for the given progress. With an outgoing frame, the
+        first half fades it out and the second half fades the incoming one in.
+        """
+        progress = table[round(progress * (len(table) - 1))]
+        if outgoing is not None and outgoing.winfo_manager():
+            alpha = max(0.0, 1 - progress * 2)
+            self._set_ramp_color(outgoing, ramp_out, alpha)
+            if alpha == 0:
+                self._fade_swap(incoming, outgoing, color_out)
+            return
 
-        if alpha < 1:
-            self.root.after(step_ms, lambda: self._fade_in(incoming, steps, step_ms, alpha))
-        else:
-            try: incoming.configure(fg_color=self._get_base_color())
-            except: pass
-            self._animating = False
-            self.root.update_idletasks()
+        start = 0.5 if outgoing is not None else 0.0
+        alpha = min(1.0, (progress - start) / (1 - start))
+        self._set_ramp_color(incoming, ramp_in, alpha)
 
-    def _reset_frame_color(self, frame, alpha):
-        """Utility to apply alpha-based background color."""
-        try: frame.configure(fg_color=self._alpha_color(alpha))
+    def _fade_swap(self, incoming, outgoing, color_out):
+        """Replaces the faded-out frame with the incoming one."""
+        outgoing.grid_forget()
+        try: outgoing.configure(fg_color=color_out)
         except: pass
+        incoming.grid(row=0, column=0, sticky=ctk.NSEW)
 
-    @staticmethod
-    def _get_base_color() -> str:
-        """Returns the default CTk background color based on the current theme."""
-        mode = ctk.get_appearance_mode()
-        return "gray86" if mode == "Light" else "gray17"
+    def _fade_done(self, incoming, outgoing, color_in, color_out, tween):
+        """Finalizes a fade transition."""
+        if outgoing is not None and outgoing.winfo_manager():
+            self._fade_swap(incoming, outgoing, color_out)
+        try: incoming.configure(fg_color=color_in)
+        except: pass
+        self.last_transition = tween.report
+        self.root.update_idletasks()
+        self._end_transition()
 
     @staticmethod
-    def _alpha_color(alpha: float) -> str:
-        """Calculates a hex color representing a fade between background and foreground."""
-        mode = ctk.get_appearance_mode()
-        if mode == "Light":
-            base, limit = 219, 180
-        else:
-            base, limit = 43, 80
-        value = int(base * alpha + limit * (1 - alpha))
-        return f"#{value:02x}{value:02x}{value:02x}"
-
-    # — Slide Transition ───────────────────────────────────────────────────
+    def _set_ramp_color(frame, ramp: list[str], alpha: float):
+        """
+        Applies the ramp color closest to the given alpha. Recoloring a frame
+        reconfigures its children, so unchanged colors are skipped.
+        """
+        color = ramp[round(alpha * (len(ramp) - 1))]
+        if frame.cget("fg_color") == color:
+            return
+        try: frame.configure(fg_color=color)
+        except: pass
 
-    def _slide(self, incoming, outgoing, direction, duration):
-        """Initiates a slide-in transition."""
+    def _color_ramp(self, frame, steps: int) -> list[str]:
+        """
+        Returns the fade colors of a frame, from its faded tone (alpha 0) to
+        its real background (alpha 1). Ramps are cached per appearance mode,
+        background color and step count.
+        """
+        mode = self._appearance_mode()
+        if mode != self._ramp_mode:
+            self._ramp_cache.clear()
+            self._ramp_mode = mode
+
+        color = self._frame_color(frame)
+        key   = (mode, color, steps)
+        ramp  = self._ramp_cache.get(key)
+        if ramp is not None:
+            return ramp
+
+        # The faded tone is darker in light mode and lighter in dark mode
+        shift  = -39 if mode == "Light" else 37
+        target = tuple(c >> 8 for c in frame.winfo_rgb(color))
+        origin = tuple(min(255, max(0, c + shift)) for c in target)
+
+        ramp = []
+        for i in range(steps + 1):
+            alpha = i / steps
+            r, g, b = (int(t * alpha + o * (1 - alpha)) for t, o in zip(target, origin))
+            ramp.append(f"#{r:02x}{g:02x}{b:02x}")
+
+        self._ramp_cache[key] = ramp
+        return ramp
+
+    # — Keyframe Tables ──────────────────────────────────────────────────
+
+    def _keyframes(self, transition: Transition, easing, frames, w, h, direction) -> list:
+        """Returns the cached keyframe table of a transition, computing it on a miss."""
+        easing = easing or self.easing or transition.easing
+        key    = (transition, easing, frames, w, h, direction)
+        table  = self._keyframe_cache.get(key)
+        if table is not None:
+            self._keyframe_cache.move_to_end(key)
+            return table
+
+        table = self._keyframe_cache[key] = transition.keyframes(w, h, direction, frames, EASINGS[easing])
+        # Resizing creates a table per size; only the recent ones are kept
+        if len(self._keyframe_cache) > 64:
+            self._keyframe_cache.popitem(last=False)
+        return table
+
+    # — Place Transitions ─────────────────────────────────────────────────
+
+    def _place_transition(self, transition, name, incoming, outgoing, direction, duration, easing=None):
+        """Initiates a transition that moves or resizes the screens (slide, cover, …)."""
         self._animating = True
         w = self._content_frame.winfo_width()
         h = self._content_frame.winfo_height()
-        steps   = max(10, duration // 16)
-        step_ms = duration // steps
-
-        offsets = {
-            SLIDE_LEFT:  (-w, 0,  w, 0),
-            SLIDE_RIGHT: ( w, 0, -w, 0),
-            SLIDE_UP:    (0, -h,  0, h),
-            SLIDE_DOWN:  (0,  h,  0, -h),
-        }
-        ix, iy, ox, oy = offsets.get(direction, offsets[SLIDE_LEFT])
-
-        incoming.place(x=ix, y=iy, relwidth=1, relheight=1)
+        self._content_size = (w, h)
+        frames = max(1, duration // FRAME_MS)
+        first  = self._keyframes(transition, easing, frames, w, h, direction)[0]
+
+        # The widgets actually moved: the screens themselves or their proxies
+        moving_in, moving_out = incoming, outgoing
+        if self.slide_proxy:
+            moving_in, moving_out = self._slide_proxies(incoming, outgoing)
+
+        # An interrupted slide hands over the position of its incoming screen,
+        # kept relative to the size so that a resize can scale it
+        sx, sy = self._retarget_from or (0, 0)
+        self._retarget_from = None
+        start = (sx / max(1, w), sy / max(1, h))
+        self._moving_in     = moving_in
+
+        moving_in.place(**first[1])
+        if moving_out:
+            moving_out.place(**dict(first[2], x=first[2]["x"] + sx, y=first[2]["y"] + sy))
+        top, bottom = (moving_in, moving_out) if transition.incoming_on_top else (moving_out, moving_in)
+        if bottom:
+            bottom.lift()
+        if top:
+            top.lift()
+
+        done = partial(self._place_done, incoming, outgoing, moving_in, moving_out)
+        self._transition_tween = self.scheduler.start(
+            name,
+            duration,
+            partial(self._place_step, transition, easing, frames, direction, moving_in, moving_out, start),
+            on_done=done,
+            on_cancel=done,
+            owner=self,
+        )
+
+    def _place_step(self, transition, easing, frames, direction, incoming, outgoing, start, progress):
+        """
+        Places both frames from the keyframe table. Tables are looked up for
+        the coalesced content size, so a resize retargets a running transition.
+        """
+        w, h  = self._content_size
+        table = self._keyframes(transition, easing, frames, w, h, direction)
+        ease, in_kw, out_kw = table[round(progress * frames)]
+
+        if in_kw is not None:
+            incoming.place(**in_kw)
+        if outgoing and out_kw is not None:
+            # An interrupted transition's outgoing screen starts off its rest position
+            if start[0] or start[1]:
+                out_kw = dict(
+                    out_kw,
+                    x=out_kw["x"] + int(start[0] * w * (1 - ease)),
+                    y=out_kw["y"] + int(start[1] * h * (1 - ease)),
+                )
+            outgoing.place(**out_kw)
+
+    def _place_done(self, incoming, outgoing, moving_in, moving_out, tween):
+        """Finalizes a place transition."""
+        self._moving_in = None
+        moving_in.place_forget()
+        if moving_out:
+            moving_out.place_forget()
+        incoming.grid(row=0, column=0, sticky=ctk.NSEW)
         if outgoing:
-            outgoing.place(x=0, y=0, relwidth=1, relheight=1)
-            outgoing.lift()
-        incoming.lift()
-
-        self._slide_step(incoming, outgoing, ix, iy, ox, oy, steps, step_ms, 0)
+            outgoing.place_forget()
+            outgoing.grid_forget()
+        self.last_transition = tween.report
+        self.root.update_idletasks()
+        self._end_transition()
 
-    def _slide_step(self, incoming, outgoing, ix, iy, ox, oy, steps, step_ms, step):
-        """Recursive step for slide animation."""
-        progress = (step + 1) / steps
-        ease     = self._ease_out(progress)
+    def _slide_proxies(self, incoming, outgoing):
+        """
+        Returns childless stand-ins colored like the given screens. The real
+        outgoing screen is hidden right away, so no screen is re-laid out
+        while the proxies move.
+        """
+        if self._proxies is None:
+            self._proxies = (
+                tk.Frame(self._content_frame, bd=0, highlightthickness=0),
+                tk.Frame(self._content_frame, bd=0, highlightthickness=0),
+            )
+        proxy_in, proxy_out = self._proxies
 
-        incoming.place(x=int(ix * (1 - ease)), y=int(iy * (1 - ease)), relwidth=1, relheight=1)
-        if outgoing:
-            outgoing.place(x=int(ox * ease), y=int(oy * ease), relwidth=1, relheight=1)
+        proxy_in.configure(bg=self._frame_color(incoming))
+        if not outgoing:
+            return proxy_in, None
 
-        if step + 1 < steps:
-            self.root.after(step_ms, lambda: self._slide_step(
-                incoming, outgoing, ix, iy, ox, oy, steps, step_ms, step + 1
-            ))
-        else:
-            incoming.place_forget()
-            incoming.grid(row=0, column=0, sticky=ctk.NSEW)
-            if outgoing:
-                outgoing.place_forget()
-                outgoing.grid_forget()
-            self._animating = False
-            self.root.update_idletasks()
+        proxy_out.configure(bg=self._frame_color(outgoing))
+        outgoing.grid_forget()
+        return proxy_in, proxy_out
 
     @staticmethod
-    def _ease_out(t: float) -> float:
-        """Quadratic ease-out formula for smoother movement."""
-        return 1 - (1 - t) ** 2
\ No newline at end of file
+    def _frame_color(frame) -> str:
+        """Resolves the background color of a CTk frame for the current appearance mode."""
+        color = frame.cget("fg_color")
+        if color == "transparent":
+            color = frame.cget("bg_color")
+        return frame._apply_appearance_mode(color)
+
+
+_IMPORT_MS[__name__] = (time.perf_counter() - _MODULE_STARTED) * 1000